@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tello XR App Logging - Application-wide logging setup
+Configures the root logger for main.py and the module self-tests (library modules only log)
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+
+
+def configure_logging(debug: bool = False):
+    """
+    Configure root logging for the application and the module self-tests.
+
+    Records are only queued by the calling thread and written out by a background
+    listener thread, so logging from a control loop never waits on console I/O.
+
+    Args:
+        debug: Log DEBUG messages as well when True
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return  # 既に設定済み
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    # 終了時にキューに残ったログを書き出してからスレッドを止める
+    atexit.register(listener.stop)
@@ -3,78 +3,359 @@ Controller Input Module for Tello XR Prototype
 This module handles game controller detection, initialization, and input processing.
 """
 
+import array
 import json
 import logging
 import os
+import stat
+import tempfile
 import time
 
+import numpy as np
 import pygame
 
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonモジュールを使う
+    orjson = None
+
+# SDLイベントキューをポンプする最小間隔(秒) - ホストのフレームレート(60Hz)に合わせる
+EVENT_PUMP_INTERVAL = 1.0 / 60
+
+# ボタンのチャタリング除去時間(ナノ秒) - この時間状態が変化しなければ確定する
+BUTTON_DEBOUNCE_NS = 10_000_000
+
+# コントローラーの接続/切断イベント
+_DEVICE_EVENTS = (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED)
+
+# 入力バッファに反映する状態変化イベント(変化した軸・ボタン・ハットのみ通知される)
+_INPUT_EVENTS = (
+    pygame.JOYAXISMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+)
+
+# handle_eventsでまとめてキューから取り出すイベント
+_HANDLED_EVENTS = _DEVICE_EVENTS + _INPUT_EVENTS
+
+# 使用しないためキューに積まないイベント(取り出さないままだとキューが溢れるため)
+_BLOCKED_EVENTS = (pygame.JOYBALLMOTION,)
+
+# 正規化後の移動キー、軸マッピングのキー、感度のキーの対応(この順で配列化する)
+_MOVEMENT_AXES = (
+    ("x", "move_x", "move_xy"),  # Left/Right movement
+    ("y", "move_y", "move_xy"),  # Forward/Backward movement
+    ("z", "move_z", "move_z"),  # Up/Down movement
+    ("rotation", "rotation", "rotation"),  # Yaw rotation
+)
+_MOVEMENT_KEYS = tuple(key for key, _, _ in _MOVEMENT_AXES)
+_ZERO_MOVEMENT = dict.fromkeys(_MOVEMENT_KEYS, 0.0)
+
+# 正規化入力で常に報告するボタン
+_BUTTON_KEYS = ("takeoff", "land", "emergency", "photo")
+
+# ボタン状態(0/1のバイト列)を"0"/"1"の文字に変換するbytes.translate()用のテーブル
+_BUTTON_DIGITS = b"0" + b"1" * 255
+
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode an object as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 class ControllerManager:
     """Manages game controller detection and initialization."""
 
-    def __init__(self, debug: bool = False, config_file: str | None = None):
+    def __init__(
+        self,
+        debug: bool = False,
+        config_file: str | None = None,
+        poll_interval: float = EVENT_PUMP_INTERVAL,
+    ):
         """
         Initialize the controller manager.
 
         Args:
             debug: Enable debug output
             config_file: Path to controller configuration file (JSON)
+            poll_interval: Minimum interval between SDL event pumps in seconds
         """
         self.debug = debug
+        self.poll_interval = poll_interval
         self.controllers = {}  # Dictionary of initialized controllers
+        self._controller_order = []  # Controller IDs in connection order
+        self._controllers_version = 0  # Incremented whenever self.controllers changes
+        self._names_cache = []
+        self._names_cache_version = 0
         self.selected_controller = None  # Currently active controller
+        self._last_pump = 0.0  # Monotonic time of the last SDL event pump
+
+        # get_normalized_input()が毎回書き換えて返す出力用の辞書(フレームごとに生成しない)
+        self._norm_out = {
+            "movement": dict.fromkeys(_MOVEMENT_KEYS, 0.0),
+            "buttons": dict.fromkeys(_BUTTON_KEYS, False),
+        }
+        self._bind_selected()
         self._setup_logging()
         self._initialize_pygame()
 
         # 設定関連の初期化
         self.config = {}
         self.config_file = config_file
+        self._config_mtime = None  # 最後に読み込んだ設定ファイルの更新時刻
+        self._config_dir_ensured = False  # 設定ファイルのディレクトリ作成済みか
         self.load_config()
 
     def _setup_logging(self):
-        """Set up logging configuration."""
-        log_level = logging.DEBUG if self.debug else logging.INFO
-        logging.basicConfig(
-            level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        """
+        Set up the module logger.
+
+        Handlers and formats are left to the application (see app_logging),
+        so creating a ControllerManager has no global logging side effects.
+        """
         self.logger = logging.getLogger("ControllerManager")
+        if self.debug:
+            self.logger.setLevel(logging.DEBUG)
+
+        # 範囲外インデックスの警告は同じインデックスにつき1回だけ出す
+        self._warned_indices = set()
 
     def _initialize_pygame(self):
-        """Initialize pygame and the joystick module."""
+        """
+        Initialize only the pygame subsystems needed for controller input.
+
+        pygame.init() would also bring up audio, fonts and the rest. The event queue
+        only needs the video subsystem, which is started with SDL's dummy driver
+        (no window) unless the application has already initialized the display or
+        chosen a driver.
+        """
         try:
-            pygame.init()
+            self._owns_display = not pygame.display.get_init()
+            if self._owns_display:
+                os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+                pygame.display.init()
             pygame.joystick.init()
+            pygame.event.set_blocked(list(_BLOCKED_EVENTS))
             self.logger.info("Pygame initialized successfully")
         except Exception as e:
-            self.logger.error(f"Failed to initialize Pygame: {e}")
+            self.logger.error("Failed to initialize Pygame: %s", e)
             raise
 
+    def _pump_once_per_frame(self) -> bool:
+        """
+        Pump the SDL event queue at most once per frame.
+
+        Returns:
+            True if the queue was pumped, False if it was already pumped this frame
+        """
+        now = time.monotonic()
+        if now - self._last_pump < self.poll_interval:
+            return False
+
+        pygame.event.pump()
+        self._last_pump = now
+        return True
+
+    def set_pump_rate(self, hz: float):
+        """
+        Set the maximum rate at which the SDL event queue is pumped.
+
+        Args:
+            hz: Pumps per second, typically the host frame rate (e.g. 60 or 120)
+        """
+        if hz <= 0:
+            raise ValueError(f"pump rate must be positive: {hz}")
+        self.poll_interval = 1.0 / hz
+
+    def wait_for_next_poll(self):
+        """Sleep until the next event pump is due, yielding the CPU in polling loops."""
+        remaining = self._last_pump + self.poll_interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _bind_selected(self):
+        """
+        Allocate reusable input buffers sized for the selected controller.
+
+        Must be called whenever the selected controller changes or a device is
+        added/removed, so that get_controller_input() can fill the buffers in place.
+        """
+        info = self.controllers.get(self.selected_controller)
+        num_axes = info["axes"] if info else 0
+        num_buttons = info["buttons"] if info else 0
+        num_hats = info["hats"] if info else 0
+
+        # 毎回の辞書参照を避けるためコントローラー情報とジョイスティック本体を直接保持
+        self._active_info = info
+        self._active_joystick = joystick = info["joystick"] if info else None
+
+        # 読み取りメソッドも束縛済みのものを保持(呼び出しごとの属性参照を避ける)
+        self._get_axis = joystick.get_axis if joystick else None
+        self._get_button = joystick.get_button if joystick else None
+        self._get_hat = joystick.get_hat if joystick else None
+
+        # 範囲チェック用に軸・ボタン・ハットの数を保持(選択中は変化しない)
+        self._num_axes = num_axes
+        self._num_buttons = num_buttons
+        self._num_hats = num_hats
+
+        # 軸数は選択中に変化しないため、軸の正規化処理もここで決めておく
+        self._normalize_axes = (
+            self._normalize_axes_vectorized if num_axes else self._normalize_axes_none
+        )
+
+        self._axes_buf = array.array("f", [0.0] * num_axes)
+        self._buttons_buf = bytearray(num_buttons)
+        self._hats_buf = [(0, 0)] * num_hats
+        self._input_buf = {
+            "axes": self._axes_buf,
+            "buttons": self._buttons_buf,
+            "hats": self._hats_buf,
+        }
+
+        # 同じメモリを共有するNumPyビュー(数値処理で毎フレーム配列を生成しないため)
+        # バッファはサイズを変えずに上書きするので、ビューは選択中ずっと有効
+        self._axes_np = np.frombuffer(self._axes_buf, dtype=np.float32)
+        self._buttons_np = np.frombuffer(self._buttons_buf, dtype=np.uint8)
+
+        # 以降はイベントで差分更新するため、選択時に一度だけ現在の状態を読み込む
+        self._last_normalized = None
+        self._last_input_key = None
+        self._axis_gain = None
+        self._poll_input_buffers()
+
+        # 選択時のボタン状態を確定済みの状態としてチャタリング除去を開始
+        self._btn_last_state = bytes(self._buttons_buf)
+        self._btn_stable = self._btn_last_state
+        self._btn_last_change_ns = 0
+
+    def _debounce_buttons(self) -> bytes:
+        """
+        Debounce the raw button states (QMK sym_defer_g algorithm).
+
+        Any change restarts the timer, and the new states are committed only once they
+        have stayed unchanged for BUTTON_DEBOUNCE_NS.
+
+        Returns:
+            Debounced button states, one byte (0 or 1) per button
+        """
+        now = time.monotonic_ns()
+        raw = bytes(self._buttons_buf)
+        if raw != self._btn_last_state:
+            self._btn_last_state = raw
+            self._btn_last_change_ns = now
+        elif raw != self._btn_stable and now - self._btn_last_change_ns >= BUTTON_DEBOUNCE_NS:
+            self._btn_stable = raw
+        return self._btn_stable
+
+    def _poll_input_buffers(self):
+        """Read every axis, button and hat of the selected controller into the buffers."""
+        self._input_dirty = True
+        if self._active_joystick is None:
+            return
+
+        # map()でループをC側で回し、束縛済みの読み取りメソッドを直接呼び出す
+        # (バッファは_input_bufから参照されているためスライス代入で上書きする)
+        # Get axis values (typically -1.0 to 1.0)
+        self._axes_buf[:] = array.array("f", map(self._get_axis, range(self._num_axes)))
+
+        # Get button values (0 or 1)
+        self._buttons_buf[:] = map(self._get_button, range(self._num_buttons))
+
+        # Get hat values (tuple of int values, typically (-1, 0, 1))
+        self._hats_buf[:] = map(self._get_hat, range(self._num_hats))
+
     def load_config(self):
         """
         設定ファイルを読み込む。
-        ファイルが指定されていない場合やエラー時はデフォルト設定を使用
+        ファイルが指定されていない場合やエラー時はデフォルト設定を使用。
+        前回の読み込みからファイルが更新されていない場合は再解析しない
         """
         # デフォルト設定を初期化
-        self.config = self.get_default_config()
+        config = self.get_default_config()
+        mtime = None
 
         if not self.config_file:
             self.logger.info("設定ファイルが指定されていません。デフォルト設定を使用します")
-            return
-
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, encoding="utf-8") as f:
-                    user_config = json.load(f)
+        else:
+            try:
+                # 存在確認はせずに直接開く(開いたファイルから更新時刻を取得する)
+                with open(self.config_file, "rb") as f:
+                    mtime = os.fstat(f.fileno()).st_mtime
+                    if mtime == self._config_mtime:
+                        # 変更がなければメモリ上の設定をそのまま使う
+                        return
+
+                    user_config = _json_loads(f.read())
                     # デフォルト設定にユーザー設定を上書き
-                    self.config.update(user_config)
-                    self.logger.info(f"設定ファイルを読み込みました: {self.config_file}")
-            else:
-                self.logger.warning(f"設定ファイルが見つかりません: {self.config_file}")
+                    config.update(user_config)
+                    self.logger.info("設定ファイルを読み込みました: %s", self.config_file)
+            except FileNotFoundError:
+                self.logger.warning("設定ファイルが見つかりません: %s", self.config_file)
                 self.save_default_config()
-        except Exception as e:
-            self.logger.error(f"設定ファイルの読み込み中にエラーが発生しました: {e}")
+            except Exception as e:
+                self.logger.error("設定ファイルの読み込み中にエラーが発生しました: %s", e)
+                config = self.get_default_config()
+                mtime = None
+
+        self.config = config
+        self._config_mtime = mtime
+        self._apply_config()
+
+    def _apply_config(self):
+        """
+        設定値をインスタンス属性に展開する。
+        毎フレームのself.config.get()呼び出しとデフォルト値の辞書生成を避けるため、
+        設定の読み込み時とキャリブレーション時にのみ実行する
+        """
+        defaults = self.get_default_config()
+        self._deadzone = self.config.get("deadzone", defaults["deadzone"])
+        button_mapping = self.config.get("button_mapping", defaults["button_mapping"])
+        axis_mapping = self.config.get("axis_mapping", defaults["axis_mapping"])
+        invert_axis = self.config.get("invert_axis", defaults["invert_axis"])
+        sensitivity = self.config.get("sensitivity", defaults["sensitivity"])
+
+        # キャリブレーションオフセットは軸インデックス順のリストで保存されている
+        # 旧形式({"0": 0.01, ...}の辞書)の設定ファイルはリストに変換して読み込む
+        axis_offsets = self.config.get("calibration", {}).get("axis_offsets", [])
+        if isinstance(axis_offsets, dict):
+            num_offsets = max((int(axis) for axis in axis_offsets), default=-1) + 1
+            axis_offsets = [axis_offsets.get(str(axis), 0) for axis in range(num_offsets)]
+        self._axis_offsets_arr = np.array(axis_offsets, dtype=np.float32)
+
+        # 移動4軸分の軸インデックス・倍率・オフセットを配列化(未割り当ての軸は-1)
+        # 倍率は反転(±1)と感度を掛け合わせた値にまとめておく
+        axis_idx, scale, offset = [], [], []
+        for _, mapping_key, sensitivity_key in _MOVEMENT_AXES:
+            axis_index = axis_mapping.get(mapping_key, -1)
+            axis_idx.append(axis_index)
+            sign = -1.0 if invert_axis.get(mapping_key) else 1.0
+            sens = sensitivity.get(sensitivity_key, defaults["sensitivity"][sensitivity_key])
+            scale.append(sign * sens)
+            has_offset = 0 <= axis_index < self._axis_offsets_arr.size
+            offset.append(self._axis_offsets_arr[axis_index] if has_offset else 0.0)
+
+        self._axis_idx = np.array(axis_idx, dtype=np.int32)
+        self._axis_scale = np.array(scale, dtype=np.float32)
+        self._offset = np.array(offset, dtype=np.float32)
+
+        # ボタンは(出力キー, ボタンインデックス)の組に展開しておく
+        self._button_plan = tuple(button_mapping.items())
+
+        # 設定が変わったので次回の正規化をやり直す
+        self._input_dirty = True
+        self._last_input_key = None
+        self._axis_gain = None
 
     def get_default_config(self):
         """
@@ -114,16 +395,12 @@ class ControllerManager:
             return False
 
         try:
-            # ディレクトリが存在しない場合は作成
-            os.makedirs(os.path.dirname(os.path.abspath(self.config_file)), exist_ok=True)
-
             # デフォルト設定を保存
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.get_default_config(), f, indent=4, ensure_ascii=False)
-            self.logger.info(f"デフォルト設定をファイルに保存しました: {self.config_file}")
+            self._write_config_file(_json_dumps(self.get_default_config()))
+            self.logger.info("デフォルト設定をファイルに保存しました: %s", self.config_file)
             return True
         except Exception as e:
-            self.logger.error(f"設定ファイルの保存中にエラーが発生しました: {e}")
+            self.logger.error("設定ファイルの保存中にエラーが発生しました: %s", e)
             return False
 
     def detect_controllers(self) -> int:
@@ -135,42 +412,66 @@ class ControllerManager:
         """
         try:
             num_controllers = pygame.joystick.get_count()
-            self.logger.info(f"Detected {num_controllers} controller(s)")
+            self.logger.info("Detected %s controller(s)", num_controllers)
 
             # Initialize all detected controllers
             for i in range(num_controllers):
-                try:
-                    joystick = pygame.joystick.Joystick(i)
-                    joystick.init()
-                    controller_id = joystick.get_instance_id()
-                    controller_info = {
-                        "joystick": joystick,
-                        "name": joystick.get_name(),
-                        "axes": joystick.get_numaxes(),
-                        "buttons": joystick.get_numbuttons(),
-                        "hats": joystick.get_numhats(),
-                    }
-                    self.controllers[controller_id] = controller_info
-                    self.logger.info(
-                        f"Initialized controller {i}: {controller_info['name']} "
-                        f"(Axes: {controller_info['axes']}, Buttons: {controller_info['buttons']})"
-                    )
-
-                    # If this is the first controller, select it automatically
-                    if self.selected_controller is None:
-                        self.selected_controller = controller_id
-                        self.logger.info(
-                            f"Automatically selected controller: {controller_info['name']}"
-                        )
-
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize controller {i}: {e}")
+                self._add_controller(i)
 
+            self._bind_selected()
             return num_controllers
         except Exception as e:
-            self.logger.error(f"Error detecting controllers: {e}")
+            self.logger.error("Error detecting controllers: %s", e)
             return 0
 
+    def _add_controller(self, device_index: int) -> int | None:
+        """
+        Initialize a single controller and register it.
+
+        Controllers that are already registered are left untouched, so hot-plugging
+        one device does not re-initialize the others.
+
+        Args:
+            device_index: SDL device index of the controller
+
+        Returns:
+            The controller's instance ID, or None if initialization failed
+        """
+        try:
+            joystick = pygame.joystick.Joystick(device_index)
+            controller_id = joystick.get_instance_id()
+            if controller_id in self.controllers:
+                return controller_id
+
+            joystick.init()
+            controller_info = {
+                "joystick": joystick,
+                "name": joystick.get_name(),
+                "axes": joystick.get_numaxes(),
+                "buttons": joystick.get_numbuttons(),
+                "hats": joystick.get_numhats(),
+            }
+            self.controllers[controller_id] = controller_info
+            self._controller_order.append(controller_id)
+            self._controllers_version += 1
+            self.logger.info(
+                "Initialized controller %s: %s (Axes: %s, Buttons: %s)",
+                device_index,
+                controller_info["name"],
+                controller_info["axes"],
+                controller_info["buttons"],
+            )
+
+            # If this is the first controller, select it automatically
+            if self.selected_controller is None:
+                self.selected_controller = controller_id
+                self.logger.info("Automatically selected controller: %s", controller_info["name"])
+
+            return controller_id
+        except Exception as e:
+            self.logger.error("Failed to initialize controller %s: %s", device_index, e)
+            return None
+
     def select_controller(self, controller_id: int) -> bool:
         """
         Select a specific controller to use.
@@ -183,49 +484,169 @@ class ControllerManager:
         """
         if controller_id in self.controllers:
             self.selected_controller = controller_id
+            self._bind_selected()
             controller_name = self.controllers[controller_id]["name"]
-            self.logger.info(f"Selected controller: {controller_name}")
+            self.logger.info("Selected controller: %s", controller_name)
             return True
         else:
-            self.logger.warning(f"Controller ID {controller_id} not found")
+            self.logger.warning("Controller ID %s not found", controller_id)
             return False
 
     def get_controller_names(self) -> list[tuple[int, str]]:
         """
         Get names of all detected controllers.
 
+        The list is rebuilt only after a controller is connected or disconnected, and
+        the same list is returned otherwise, so callers must not modify it.
+
         Returns:
             List of (controller_id, name) tuples
         """
-        return [(controller_id, info["name"]) for controller_id, info in self.controllers.items()]
+        if self._names_cache_version != self._controllers_version:
+            self._names_cache = [
+                (controller_id, info["name"]) for controller_id, info in self.controllers.items()
+            ]
+            self._names_cache_version = self._controllers_version
+        return self._names_cache
 
     def handle_events(self):
-        """Process pygame events to detect controller connections/disconnections."""
-        for event in pygame.event.get():
+        """
+        Process pygame events to detect controller connections/disconnections.
+
+        This is the single place where the SDL event queue is pumped, so it should be
+        called once per frame before reading controller input. Axis, button and hat
+        events of the selected controller are applied to the input buffers here.
+        """
+        self._pump_once_per_frame()
+
+        # キューに対象のイベントが無ければ取り出し処理(イベントのコピー)を省く
+        if pygame.event.peek(_HANDLED_EVENTS, pump=False):
+            self._process_events(pygame.event.get(_HANDLED_EVENTS, pump=False))
+        self._discard_unhandled_events()
+
+    def wait_for_events(self, timeout: float | None = None) -> bool:
+        """
+        Block until a controller event arrives, then process all pending events.
+
+        An alternative to handle_events() + wait_for_next_poll() for loops that only
+        need to react to input changes: it returns as soon as an event is queued
+        instead of sleeping for a fixed interval.
+
+        Args:
+            timeout: Maximum time to wait in seconds (defaults to poll_interval)
+
+        Returns:
+            True if at least one event was processed, False if the wait timed out
+        """
+        if timeout is None:
+            timeout = self.poll_interval
+        deadline = time.monotonic() + timeout
+
+        # event.wait()はキューをポンプしてから待機する
+        # (コントローラー以外のイベントは読み捨てて、残り時間で待機を続ける)
+        while True:
+            first = pygame.event.wait(max(1, int(timeout * 1000)))
+            now = time.monotonic()
+            self._last_pump = now
+            if first.type == pygame.NOEVENT:
+                return False
+            if first.type in _HANDLED_EVENTS:
+                break
+            timeout = deadline - now
+            if timeout <= 0:
+                return False
+
+        self._process_events([first, *pygame.event.get(_HANDLED_EVENTS, pump=False)])
+        self._discard_unhandled_events()
+        return True
+
+    def _discard_unhandled_events(self):
+        """
+        Drop the events left in the queue after the controller events were taken out.
+
+        When this class initialized the display, nothing else reads the queue, so any
+        other event type would stay queued until SDL's queue limit is reached and new
+        controller events are dropped. An application that owns the display drains its
+        own events.
+        """
+        if self._owns_display:
+            pygame.event.clear(pump=False)
+
+    def _process_events(self, events):
+        """
+        Apply a batch of controller events to the input buffers and controller list.
+
+        Args:
+            events: pygame events in queue order (other event types are ignored)
+        """
+        # 接続・切断イベントはキューを一度に処理し終えてからまとめて反映する
+        # (同時に複数台が抜き差しされても_bind_selected()による再読み込みは1回で済む)
+        device_events = []
+        for event in events:
+            if event.type not in _INPUT_EVENTS:
+                if event.type in _DEVICE_EVENTS:
+                    device_events.append(event)
+                continue
+
+            if event.instance_id != self.selected_controller:
+                continue
+
+            # 変化のあった軸・ボタン・ハットだけをバッファに反映
+            if event.type == pygame.JOYAXISMOTION:
+                self._axes_buf[event.axis] = event.value
+            elif event.type == pygame.JOYHATMOTION:
+                self._hats_buf[event.hat] = event.value
+            else:
+                self._buttons_buf[event.button] = event.type == pygame.JOYBUTTONDOWN
+            self._input_dirty = True
+
+        if device_events:
+            self._handle_device_events(device_events)
+
+    def _handle_device_events(self, events):
+        """
+        Apply a batch of controller connection/disconnection events.
+
+        The input buffers are re-bound at most once, and only when the selected
+        controller changed, so the selection's current state is read a single time
+        even if several devices are hot-plugged within one frame.
+
+        Args:
+            events: JOYDEVICEADDED/JOYDEVICEREMOVED events in queue order
+        """
+        previous_selection = self.selected_controller
+
+        for event in events:
             if event.type == pygame.JOYDEVICEADDED:
-                self.logger.info(f"Controller connected: {event.device_index}")
-                # Re-detect controllers to include the new one
-                self.detect_controllers()
+                self.logger.info("Controller connected: %s", event.device_index)
+                # 新しいデバイスだけを追加(既存のコントローラーは再初期化しない)
+                self._add_controller(event.device_index)
 
             elif event.type == pygame.JOYDEVICEREMOVED:
-                self.logger.info(f"Controller disconnected: {event.instance_id}")
+                self.logger.info("Controller disconnected: %s", event.instance_id)
                 # Remove the disconnected controller
                 if event.instance_id in self.controllers:
                     del self.controllers[event.instance_id]
+                    self._controller_order.remove(event.instance_id)
+                    self._controllers_version += 1
 
                 # If the selected controller was removed, select a new one if available
+                # (最も早く接続されたコントローラーを選ぶ)
                 if event.instance_id == self.selected_controller:
-                    self.selected_controller = (
-                        next(iter(self.controllers)) if self.controllers else None
-                    )
-                    if self.selected_controller:
+                    order = self._controller_order
+                    self.selected_controller = order[0] if order else None
+                    if self.selected_controller is not None:
                         controller_name = self.controllers[self.selected_controller]["name"]
                         self.logger.info(
-                            f"Automatically selected new controller: {controller_name}"
+                            "Automatically selected new controller: %s", controller_name
                         )
                     else:
                         self.logger.warning("No controllers available")
 
+        # 選択中のコントローラーが変わった場合だけバッファを割り当て直す
+        if self.selected_controller != previous_selection:
+            self._bind_selected()
+
     def is_controller_available(self) -> bool:
         """
         Check if any controller is available and selected.
@@ -245,7 +666,20 @@ class ControllerManager:
         if not self.is_controller_available():
             return None
 
-        return self.controllers.get(self.selected_controller)
+        return self._active_info
+
+    def _warn_out_of_range(self, kind: str, index: int):
+        """
+        Log an out-of-range index warning once per (kind, index).
+
+        Args:
+            kind: Input kind shown in the message ("Axis", "Button" or "Hat")
+            index: The requested index
+        """
+        key = (kind, index)
+        if key not in self._warned_indices:
+            self._warned_indices.add(key)
+            self.logger.warning("%s index %d out of range", kind, index)
 
     def read_axis(self, axis_index: int) -> float:
         """
@@ -257,20 +691,17 @@ class ControllerManager:
         Returns:
             Axis value between -1.0 and 1.0, or 0.0 if no controller is available
         """
-        if not self.is_controller_available():
+        # 切断時はhandle_events()で読み取りメソッドがNoneになるため例外処理は不要
+        get_axis = self._get_axis
+        if get_axis is None:
             return 0.0
 
-        try:
-            joystick = self.controllers[self.selected_controller]["joystick"]
-            if axis_index >= joystick.get_numaxes():
-                self.logger.warning(f"Axis index {axis_index} out of range")
-                return 0.0
-
-            return joystick.get_axis(axis_index)
-        except Exception as e:
-            self.logger.error(f"Error reading axis {axis_index}: {e}")
+        if not 0 <= axis_index < self._num_axes:
+            self._warn_out_of_range("Axis", axis_index)
             return 0.0
 
+        return get_axis(axis_index)
+
     def read_button(self, button_index: int) -> bool:
         """
         Read the state of a specific button from the selected controller.
@@ -281,20 +712,16 @@ class ControllerManager:
         Returns:
             True if the button is pressed, False otherwise or if no controller is available
         """
-        if not self.is_controller_available():
+        get_button = self._get_button
+        if get_button is None:
             return False
 
-        try:
-            joystick = self.controllers[self.selected_controller]["joystick"]
-            if button_index >= joystick.get_numbuttons():
-                self.logger.warning(f"Button index {button_index} out of range")
-                return False
-
-            return bool(joystick.get_button(button_index))
-        except Exception as e:
-            self.logger.error(f"Error reading button {button_index}: {e}")
+        if not 0 <= button_index < self._num_buttons:
+            self._warn_out_of_range("Button", button_index)
             return False
 
+        return bool(get_button(button_index))
+
     def read_hat(self, hat_index: int) -> tuple[int, int]:
         """
         Read the values of a hat (D-pad) from the selected controller.
@@ -305,26 +732,26 @@ class ControllerManager:
         Returns:
             Tuple of (x, y) values, each either -1, 0, or 1, or (0, 0) if no controller is available
         """
-        if not self.is_controller_available():
+        get_hat = self._get_hat
+        if get_hat is None:
             return (0, 0)
 
-        try:
-            joystick = self.controllers[self.selected_controller]["joystick"]
-            if hat_index >= joystick.get_numhats():
-                self.logger.warning(f"Hat index {hat_index} out of range")
-                return (0, 0)
-
-            return joystick.get_hat(hat_index)
-        except Exception as e:
-            self.logger.error(f"Error reading hat {hat_index}: {e}")
+        if not 0 <= hat_index < self._num_hats:
+            self._warn_out_of_range("Hat", hat_index)
             return (0, 0)
 
+        return get_hat(hat_index)
+
     def get_controller_input(
         self,
-    ) -> dict[str, list[float] | list[bool] | list[tuple[int, int]]] | None:
+    ) -> dict[str, array.array | bytearray | list[tuple[int, int]]] | None:
         """
         Get the current input state from the selected controller.
 
+        The buffers are kept up to date by handle_events(), which should be called once
+        per frame before this method, so no joystick polling happens here. The returned
+        dictionary and its buffers are reused, so copy them if they need to be kept.
+
         Returns:
             Dictionary with controller input states (axes, buttons, hats) 
             or None if no controller is selected
@@ -332,31 +759,20 @@ class ControllerManager:
         if not self.is_controller_available():
             return None
 
-        # Process pygame events to ensure we have the latest state
-        pygame.event.pump()
-
-        joystick = self.controllers[self.selected_controller]["joystick"]
-        controller_input = {"axes": [], "buttons": [], "hats": []}
-
-        # Get axis values (typically -1.0 to 1.0)
-        for i in range(joystick.get_numaxes()):
-            controller_input["axes"].append(joystick.get_axis(i))
-
-        # Get button values (0 or 1)
-        for i in range(joystick.get_numbuttons()):
-            controller_input["buttons"].append(joystick.get_button(i) == 1)
-
-        # Get hat values (tuple of int values, typically (-1, 0, 1))
-        for i in range(joystick.get_numhats()):
-            controller_input["hats"].append(joystick.get_hat(i))
-
-        return controller_input
+        return self._input_buf
 
     def get_normalized_input(self) -> dict[str, dict[str, float] | dict[str, bool]] | None:
         """
         Get normalized input values mapped to more intuitive controls.
         Normalizes controller inputs based on configuration settings.
 
+        The previous result is returned as-is when no input event has arrived since
+        the last call, or when the raw axis and debounced button values are identical
+        to the previous frame. Button states are debounced before they are reported.
+
+        The same dictionary is updated in place and returned on every call, so copy it
+        (or use get_normalized_input_into()) to keep values across calls.
+
         Returns:
             Dictionary with movement, rotation, and button states 
             or None if no controller is selected
@@ -364,130 +780,121 @@ class ControllerManager:
         if not self.is_controller_available():
             return None
 
-        raw_input = self.get_controller_input()
-        if not raw_input:
-            return None
+        if not self._input_dirty and self._last_normalized is not None:
+            return self._last_normalized
 
-        # 設定から必要な値を取得
-        deadzone = self.config.get("deadzone", 0.15)
-        axis_mapping = self.config.get(
-            "axis_mapping", {"move_x": 0, "move_y": 1, "move_z": 3, "rotation": 2}
-        )
-        button_mapping = self.config.get(
-            "button_mapping", {"takeoff": 0, "land": 1, "emergency": 2, "photo": 3}
-        )
-        invert_axis = self.config.get("invert_axis", {"move_y": True, "move_z": True})
-        sensitivity = self.config.get(
-            "sensitivity", {"move_xy": 1.0, "move_z": 0.7, "rotation": 0.8}
-        )
+        # ボタンはチャタリング除去済みの状態を使う(確定待ちの間は次回も再計算する)
+        button_states = self._debounce_buttons()
+        self._input_dirty = self._btn_stable != self._btn_last_state
 
-        # キャリブレーションデータの取得
-        calibration = self.config.get("calibration", {})
-        axis_offsets = calibration.get("axis_offsets", {})
+        # 生の入力値(バイト列)が前回と同じなら正規化処理を省略して前回の結果を返す
+        input_key = self._axes_buf.tobytes() + button_states
+        if input_key == self._last_input_key:
+            return self._last_normalized
+        self._last_input_key = input_key
 
-        # 初期化
-        movement = {
-            "x": 0.0,  # Left/Right movement
-            "y": 0.0,  # Forward/Backward movement
-            "z": 0.0,  # Up/Down movement
-            "rotation": 0.0,  # Yaw rotation
-        }
-
-        buttons = {
-            "takeoff": False,
-            "land": False,
-            "emergency": False,
-            "photo": False,
-        }
+        # 出力用の辞書を書き換える
+        buttons = self._norm_out["buttons"]
 
-        # 軸の入力を適用(設定に基づく)
-        axes = raw_input["axes"]
-        if len(axes) > 0:
-            # 各動きに対応する軸を適用
-            for key, axis_index in axis_mapping.items():
-                if axis_index < len(axes):
-                    # 生の軸の値を取得
-                    value = axes[axis_index]
-
-                    # キャリブレーションオフセットを適用(もし存在すれば)
-                    offset = float(axis_offsets.get(str(axis_index), 0))
-                    value = value - offset
-
-                    # 軸の反転が設定されている場合は反転
-                    if invert_axis.get(key):
-                        value = -value
-
-                    # 感度の適用
-                    if key in ["move_x", "move_y"]:
-                        value *= sensitivity.get("move_xy", 1.0)
-                    elif key == "move_z":
-                        value *= sensitivity.get("move_z", 0.7)
-                    elif key == "rotation":
-                        value *= sensitivity.get("rotation", 0.8)
-
-                    # 対応する動きに値を割り当て
-                    if key == "move_x":
-                        movement["x"] = value
-                    elif key == "move_y":
-                        movement["y"] = value
-                    elif key == "move_z":
-                        movement["z"] = value
-                    elif key == "rotation":
-                        movement["rotation"] = value
+        # 軸の入力を適用(コントローラー選択時に軸の有無に応じた処理を割り当て済み)
+        self._normalize_axes(self._norm_out["movement"])
 
         # ボタンの入力を適用(設定に基づく)
-        button_states = raw_input["buttons"]
-        if len(button_states) > 0:
-            for key, button_index in button_mapping.items():
-                if button_index < len(button_states):
-                    buttons[key] = button_states[button_index]
-
-        # デッドゾーンを適用
-        for key in movement:
-            if abs(movement[key]) < deadzone:
-                movement[key] = 0.0
-            elif movement[key] > 0:
-                # デッドゾーン以上の値を0-1の範囲に再マッピング
-                movement[key] = (movement[key] - deadzone) / (1 - deadzone)
-            else:
-                # デッドゾーン以上の値を-1-0の範囲に再マッピング
-                movement[key] = (movement[key] + deadzone) / (1 - deadzone)
+        for key in _BUTTON_KEYS:
+            buttons[key] = False
+        num_buttons = len(button_states)
+        for key, button_index in self._button_plan:
+            if button_index < num_buttons:
+                buttons[key] = bool(button_states[button_index])
 
-        return {
-            "movement": movement,
-            "buttons": buttons,
-        }
+        self._last_normalized = self._norm_out
+        return self._last_normalized
+
+    def _normalize_axes_none(self, movement: dict[str, float]):
+        """Report zero movement for controllers without axes."""
+        movement.update(_ZERO_MOVEMENT)
+
+    def _normalize_axes_vectorized(self, movement: dict[str, float]):
+        """
+        Apply offset, inversion, sensitivity and deadzone to the mapped axes.
+
+        Args:
+            movement: Movement dictionary to update in place
+        """
+        raw = self._axes_np
+
+        # コントローラーに存在しない軸が割り当てられている場合は倍率を0にして0のままにする
+        # (設定かコントローラーが変わったときだけ計算し、毎フレームのマスク処理を省く)
+        if self._axis_gain is None:
+            valid = (self._axis_idx >= 0) & (self._axis_idx < raw.size)
+            self._axis_gain = np.where(valid, self._axis_scale, 0.0).astype(np.float32)
+        values = raw.take(self._axis_idx, mode="clip")
+
+        # オフセット補正・反転・感度を一括で適用
+        values = (values - self._offset) * self._axis_gain
+
+        # デッドゾーンを適用し、デッドゾーン以上の値を0-1(負側は-1-0)の範囲に再マッピング
+        # 大きさだけを計算して元の符号を付け直す(デッドゾーン内は大きさ0になる)
+        # +0.0で-0.0を0.0に正規化する(表示が"-0.00"にならないように)
+        deadzone = self._deadzone
+        magnitude = np.maximum(np.abs(values) - deadzone, 0.0) / (1 - deadzone)
+        values = np.copysign(magnitude, values) + 0.0
+
+        movement.update(zip(_MOVEMENT_KEYS, values.tolist(), strict=True))
+
+    def get_normalized_input_into(
+        self, out: dict[str, dict[str, float] | dict[str, bool]]
+    ) -> dict[str, dict[str, float] | dict[str, bool]] | None:
+        """
+        Copy the normalized input into a caller-owned dictionary.
+
+        Args:
+            out: Dictionary with "movement" and "buttons" sub-dictionaries to update
 
-    def read_all_inputs(self) -> dict:
+        Returns:
+            The updated out dictionary, or None if no controller is selected
+        """
+        normalized = self.get_normalized_input()
+        if normalized is None:
+            return None
+
+        out["movement"].update(normalized["movement"])
+        out["buttons"].update(normalized["buttons"])
+        return out
+
+    def read_all_inputs(self) -> dict[str, np.ndarray]:
         """
         Read all inputs from the selected controller.
 
         Returns:
-            Dictionary with all controller inputs, or empty dict if no controller is available
+            Dictionary with all controller inputs as NumPy arrays (axes: float32,
+            buttons: uint8, hats: int8 of shape (n, 2)), or empty dict if no
+            controller is available. The arrays are copies owned by the caller.
         """
         if not self.is_controller_available():
             return {}
 
         try:
-            joystick = self.controllers[self.selected_controller]["joystick"]
-            inputs = {
-                "axes": [joystick.get_axis(i) for i in range(joystick.get_numaxes())],
-                "buttons": [joystick.get_button(i) for i in range(joystick.get_numbuttons())],
-                "hats": [joystick.get_hat(i) for i in range(joystick.get_numhats())],
+            # イベントを待たずにコントローラーから直接読み込む
+            # (SDL側の状態を更新するためのポンプはフレームレートに合わせて間引く)
+            self._pump_once_per_frame()
+            self._poll_input_buffers()
+            # バッファはC配列なのでバッファプロトコル経由で一括コピーする(要素ごとのボックス化なし)
+            return {
+                "axes": self._axes_np.copy(),
+                "buttons": self._buttons_np.copy(),
+                "hats": np.array(self._hats_buf, dtype=np.int8).reshape(-1, 2),
             }
-
-            # Update events to ensure we're capturing the latest button states
-            pygame.event.pump()
-
-            return inputs
         except Exception as e:
-            self.logger.error(f"Error reading all inputs: {e}")
+            self.logger.error("Error reading all inputs: %s", e)
             return {}
 
     def cleanup(self):
         """Clean up pygame resources."""
         pygame.joystick.quit()
-        pygame.quit()
+        # アプリケーション側で初期化したディスプレイは終了しない
+        if self._owns_display:
+            pygame.display.quit()
         self.logger.info("Pygame resources cleaned up")
 
     def calibrate_controller(self, samples=10, delay=0.1):
@@ -507,42 +914,48 @@ class ControllerManager:
             return False
 
         try:
-            self.logger.info(f"コントローラーのキャリブレーションを開始します({samples}サンプル)")
+            self.logger.info("コントローラーのキャリブレーションを開始します(%sサンプル)", samples)
             print("コントローラーのスティックを放し、中立位置に戻してください...")
 
             # キャリブレーション前の待機時間
             time.sleep(1.0)
 
             # 軸のオフセット値を測定
-            axis_offsets = {}
-            joystick = self.controllers[self.selected_controller]["joystick"]
-            num_axes = joystick.get_numaxes()
+            axis_offsets = []
+            get_axis = self._get_axis
+            num_axes = self._num_axes
 
-            # 各軸のオフセットサンプルを収集
-            axis_samples = {i: [] for i in range(num_axes)}
+            # 各軸のオフセットサンプルを収集(軸数 x サンプル数の2次元配列)
+            axis_samples = np.empty((num_axes, samples), dtype=np.float32)
+
+            # 進捗表示は全体の25%ごとにのみ更新する(毎サンプルの端末出力を避ける)
+            progress_step = max(1, samples // 4)
 
             for sample in range(samples):
-                pygame.event.pump()  # イベントを処理して最新の状態を取得
+                self._pump_once_per_frame()  # イベントを処理して最新の状態を取得
 
                 for axis in range(num_axes):
-                    axis_samples[axis].append(joystick.get_axis(axis))
+                    axis_samples[axis, sample] = get_axis(axis)
 
                 time.sleep(delay)
-                print(f"サンプル {sample+1}/{samples} 収集中...", end="\r")
+                collected = sample + 1
+                if collected % progress_step == 0 or collected == samples:
+                    print(f"サンプル {collected}/{samples} 収集中...", end="\r", flush=True)
 
             print("\nキャリブレーション完了!")
 
             # 各軸のオフセット平均値を計算
-            for axis in range(num_axes):
-                if axis_samples[axis]:
-                    axis_offsets[str(axis)] = sum(axis_samples[axis]) / len(axis_samples[axis])
+            if samples > 0:
+                # 軸インデックス順のリストとして保存する
+                axis_offsets = axis_samples.mean(axis=1).tolist()
 
             # 設定に保存
             if "calibration" not in self.config:
                 self.config["calibration"] = {}
 
             self.config["calibration"]["axis_offsets"] = axis_offsets
-            self.logger.info(f"軸オフセット値を設定しました: {axis_offsets}")
+            self._apply_config()
+            self.logger.info("軸オフセット値を設定しました: %s", axis_offsets)
 
             # 設定ファイルにキャリブレーション結果を保存
             self._save_config()
@@ -550,7 +963,7 @@ class ControllerManager:
             return True
 
         except Exception as e:
-            self.logger.error(f"キャリブレーション中にエラーが発生しました: {e}")
+            self.logger.error("キャリブレーション中にエラーが発生しました: %s", e)
             return False
 
     def _save_config(self):
@@ -560,18 +973,59 @@ class ControllerManager:
             return False
 
         try:
-            # ディレクトリが存在しない場合は作成
-            os.makedirs(os.path.dirname(os.path.abspath(self.config_file)), exist_ok=True)
-
             # 設定を保存
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-            self.logger.info(f"設定をファイルに保存しました: {self.config_file}")
+            # 保存した内容はメモリ上の設定と同じなので、次回のload_configで再解析しない
+            self._config_mtime = self._write_config_file(_json_dumps(self.config))
+            self.logger.info("設定をファイルに保存しました: %s", self.config_file)
             return True
         except Exception as e:
-            self.logger.error(f"設定ファイルの保存中にエラーが発生しました: {e}")
+            self.logger.error("設定ファイルの保存中にエラーが発生しました: %s", e)
             return False
 
+    def _write_config_file(self, data: bytes) -> float:
+        """
+        設定ファイルをアトミックに書き込む。
+        同じディレクトリの一時ファイルに書き込んでからos.replaceで置き換えるため、
+        書き込み途中で中断しても壊れた設定ファイルが残らない
+
+        Args:
+            data: 書き込むJSONのバイト列
+
+        Returns:
+            float: 書き込んだ設定ファイルの更新時刻
+        """
+        # シンボリックリンクの場合はリンク自体ではなくリンク先のファイルを置き換える
+        target = os.path.realpath(self.config_file)
+        config_dir = os.path.dirname(target)
+
+        # ディレクトリが存在しない場合は作成(一度作成・確認したら以降は省略)
+        if not self._config_dir_ensured:
+            os.makedirs(config_dir, exist_ok=True)
+            self._config_dir_ensured = True
+
+        # mkstempは0600で作成するため、既存ファイルのパーミッションを引き継ぐ
+        # (新規作成時は通常のopenと同じくumaskを適用した0666)
+        try:
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        fd, tmp_path = tempfile.mkstemp(dir=config_dir, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        # 書き込みと置き換えが完了した後の更新時刻を返す(load_configが比較する値と一致させる)
+        return os.stat(target).st_mtime
+
 
 # Simple test function
 def test_controller_detection():
@@ -629,21 +1083,28 @@ def run_input_test(manager):
     """コントローラー入力のテストを実行する"""
     print("\nPress Ctrl+C to exit")
     print("Reading controller input (live display)...")
+    last_norm_display = 0.0
     try:
         while True:
+            # 入力イベントが届くまで待機し、届いたらすぐに処理する(固定間隔のスリープなし)
+            # (タイムアウト時もボタンのチャタリング除去を確定させるため正規化処理は行う)
+            has_events = manager.wait_for_events()
+
             # Get and display raw controller input
-            raw_input = manager.get_controller_input()
+            raw_input = manager.get_controller_input() if has_events else None
             if raw_input:
                 # Clear the line using ANSI escape code
                 print("\033[K", end="\r")  # Clear to the end of line
                 axes_str = ", ".join([f"{val:.2f}" for val in raw_input["axes"]])
-                buttons_str = "".join(["1" if b else "0" for b in raw_input["buttons"]])
+                buttons_str = raw_input["buttons"].translate(_BUTTON_DIGITS).decode("ascii")
                 print(f"Axes: [{axes_str}] | Buttons: {buttons_str}", end="\r")
 
             # Process normalized input for drone control
             norm_input = manager.get_normalized_input()
-            if norm_input and hasattr(time, "monotonic") and int(time.monotonic()) % 3 == 0:
+            now = time.monotonic()
+            if norm_input and now - last_norm_display >= 3.0:
                 # Every ~3 seconds, show the normalized values
+                last_norm_display = now
                 m = norm_input["movement"]
                 b = norm_input["buttons"]
                 print("\nNormalized Input:")
@@ -655,12 +1116,13 @@ def run_input_test(manager):
                     f"  Buttons: Takeoff:{b['takeoff']} Land:{b['land']} "
                     f"Emergency:{b['emergency']} Photo:{b['photo']}"
                 )
-
-            time.sleep(0.1)
     except KeyboardInterrupt:
         print("\nTest ended by user")
 
 
 if __name__ == "__main__":
+    from app_logging import configure_logging
+
+    configure_logging(debug=True)
     # Use the test function to see controller inputs
     test_controller_detection()
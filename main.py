@@ -3,18 +3,35 @@
 Main entry point for the Tello XR prototype.
 Program to display and control video stream from Tello drone
 """
+import logging
 import sys
 import time
 from threading import Event, Thread
 
+import cv2
+import numpy as np
+import pygame
 from controller_input import ControllerManager
 
+from app_logging import configure_logging
 from tello_control import TelloControl
 from video_stream import VideoStream  # Using the enhanced video stream module
 
+# ループ内のメッセージはロガー経由で出力する
+# (configure_logging()によりバックグラウンドのスレッドで書き出され、ループが出力待ちで止まらない)
+logger = logging.getLogger(__name__)
+
+# ボタンの押下状態をまとめて扱うためのビット(押された瞬間をビット演算で判定する)
+TAKEOFF_BIT = 1 << 0
+LAND_BIT = 1 << 1
+EMERGENCY_BIT = 1 << 2
+PHOTO_BIT = 1 << 3
+
 
 def main():
     """Main execution function"""
+    # ログ出力の設定はアプリケーション側で行う(ライブラリでは設定しない)
+    configure_logging()
     print("Tello XR prototype initialized!")
     print("Using improved H.264 video stream decoder with error recovery")
     tello = None
@@ -24,6 +41,9 @@ def main():
     # プログラム終了フラグ
     exit_event = Event()
 
+    # スティック入力の更新をRCスレッドに通知するイベント
+    rc_input_event = Event()
+
     # ビデオ再接続関連変数
     video_reconnect_attempts = 0
     max_video_reconnect = 5
@@ -41,9 +61,13 @@ def main():
             "movement": {"x": 0.0, "y": 0.0, "z": 0.0, "rotation": 0.0},
             "buttons": {"takeoff": False, "land": False, "emergency": False, "photo": False},
         },
+        # RCスレッドに渡すスティック入力(x, y, z, rotation)
+        # 書き換えられないタプルを丸ごと差し替えるため、読み出し側で値が混ざらない
+        "rc_input": (0.0, 0.0, 0.0, 0.0),
         "error_count": 0,  # エラーカウンター
         "last_error": "",  # 最後のエラーメッセージ
         "recovery_mode": False,  # 復旧モード
+        "pending_command": None,  # 実行中の離陸・着陸・緊急停止コマンド
         # テレメトリーデータ用の初期値
         "height": 0,  # 高度 (cm)
         "vgx": 0,  # X軸速度 (cm/s)
@@ -114,7 +138,7 @@ def main():
         print(" - iキー: UI情報表示の切り替え")
 
         # ボタン状態の前回値(連続実行防止用)
-        prev_button_states = {"takeoff": False, "land": False, "emergency": False, "photo": False}
+        prev_pressed_bits = 0
 
         # 飛行状態
         is_flying = False
@@ -128,24 +152,33 @@ def main():
 
         # RCコマンド送信用のスレッドを開始
         rc_thread = Thread(
-            target=rc_control_thread, args=(tello, controller, drone_state, exit_event), daemon=True
+            target=rc_control_thread,
+            args=(tello, controller, drone_state, exit_event, rc_input_event),
+            daemon=True,
         )
         rc_thread.start()
 
         # バッテリー残量取得のための変数
-        last_battery_check = time.time()
-        battery_check_interval = 10  # バッテリー残量を10秒ごとに更新
+        # バッテリー残量とテレメトリーの定期取得は別スレッドで行う
+        # (応答待ちでメインループの映像表示が止まらないようにする)
+        telemetry_thread = Thread(
+            target=telemetry_update_thread, args=(tello, drone_state, exit_event), daemon=True
+        )
+        telemetry_thread.start()
 
-        # ビデオ再接続関連変数
-        video_reconnect_attempts = 0
-        max_video_reconnect = 5
-        last_video_reconnect = 0
-        reconnect_cooldown = 10  # 再接続のクールダウン時間(秒)
+        # 表示用フレームのダブルバッファ(最初のフレーム受信時に確保し、毎フレームの確保を避ける)
+        display_bufs = None
+        active_buf = 0
+
+        # HUDに渡す状態(毎フレーム辞書を作り直さず、値だけ書き換える)
+        hud_state = {"drone_state": drone_state}
 
         # メインループ: ビデオフレーム処理、UI表示、キー入力処理
         while not exit_event.is_set():
             try:
-                loop_start_time = time.time()  # ループの実行時間測定用
+                # ループの開始時刻(実行時間の測定と各種の間隔判定で共用する)
+                # 時刻合わせで巻き戻らないようにmonotonicを使う
+                now = time.monotonic()
 
                 # コントローラーのイベント処理(接続/切断検出)
                 if controller:
@@ -154,63 +187,46 @@ def main():
                 # Get video frame
                 ret, frame = video.read_frame()
                 if not ret or frame is None:
-                    print(f"Frame reception failed - retrying (status: {video.connection_status})")
+                    logger.warning(
+                        "Frame reception failed - retrying (status: %s)", video.connection_status
+                    )
 
                     # Connection loss reconnection logic
-                    current_time = time.time()
                     if (
                         (video.connection_status in ["Disconnected", "Read Error", "Frame Error"])
-                        and (current_time - last_video_reconnect > reconnect_cooldown)
+                        and (now - last_video_reconnect > reconnect_cooldown)
                         and (video_reconnect_attempts < max_video_reconnect)
                     ):
 
-                        print(
-                            f"Attempting to reconnect video stream... "
-                            f"(attempt {video_reconnect_attempts+1}/{max_video_reconnect})"
+                        logger.info(
+                            "Attempting to reconnect video stream... (attempt %d/%d)",
+                            video_reconnect_attempts + 1,
+                            max_video_reconnect,
                         )
                         # Release current capture
                         video.release()
                         # Reconnect
                         if video.connect():
-                            print("Successfully reconnected to video stream")
+                            logger.info("Successfully reconnected to video stream")
                             video_reconnect_attempts = 0  # Reset counter on success
                             # Track metrics for decode errors
                             drone_state["video_decode_errors"] = 0
                         else:
                             video_reconnect_attempts += 1
-                            print(
-                                f"Failed to reconnect video stream "
-                                f"(attempt {video_reconnect_attempts}/{max_video_reconnect})"
+                            logger.warning(
+                                "Failed to reconnect video stream (attempt %d/%d)",
+                                video_reconnect_attempts,
+                                max_video_reconnect,
                             )
 
-                        last_video_reconnect = current_time
+                        last_video_reconnect = now
 
-                    time.sleep(0.1)
+                    # read_frame()はグラバースレッドの新しいフレームを待ってから失敗を返すため、
+                    # 追加の待機は待たずに失敗した場合(キャプチャが無いとき)だけ行う
+                    if not video.is_grabbing:
+                        time.sleep(0.1)
                     continue
 
-                # 定期的にバッテリー残量とテレメトリーデータを更新
-                current_time = time.time()
-                if current_time - last_battery_check > battery_check_interval:
-                    # バッテリー情報の取得と更新
-                    battery_level = tello.get_battery()
-                    if battery_level > 0:
-                        drone_state["battery"] = battery_level
-                        # バッテリー残量が低い場合は警告
-                        if battery_level <= 15:
-                            print(f"警告: バッテリー残量が低下しています ({battery_level}%)")
-
-                    # テレメトリーデータの取得と更新
-                    telemetry_data = tello.get_telemetry_data()
-                    if telemetry_data:
-                        print(f"Received telemetry data: {telemetry_data}")
-                        # テレメトリー情報をdrone_stateに統合
-                        for key, value in telemetry_data.items():
-                            drone_state[key] = value
-                    else:
-                        print("No telemetry data received")
-
-                    last_battery_check = current_time
-
                 # コントローラー入力の取得
                 input_data = None
                 if controller and controller.is_controller_available():
@@ -218,104 +234,127 @@ def main():
                     if input_data and "buttons" in input_data:
                         button_states = input_data["buttons"]
 
+                        # 押下状態をビットにまとめ、前回押されていなくて今回押されたボタンを求める
+                        pressed_bits = (
+                            button_states["takeoff"] * TAKEOFF_BIT
+                            | button_states["land"] * LAND_BIT
+                            | button_states["emergency"] * EMERGENCY_BIT
+                            | button_states["photo"] * PHOTO_BIT
+                        )
+                        just_pressed = pressed_bits & ~prev_pressed_bits
+
+                        # 離陸・着陸は別スレッドで完了するため、飛行状態はdrone_stateから取得
+                        is_flying = drone_state["is_flying"]
+                        command_pending = drone_state["pending_command"] is not None
+
                         # ボタン入力によるドローン操作
                         # 離陸(A/Xボタン): 前回押されていなくて今回押された場合に実行
-                        if (
-                            button_states["takeoff"]
-                            and not prev_button_states["takeoff"]
-                            and not is_flying
-                        ):
-                            print("離陸コマンド実行")
-                            if tello.takeoff():
-                                is_flying = True
-                                # ドローン状態を更新
-                                drone_state["is_flying"] = True
-                                drone_state["rc_control_enabled"] = True
+                        if just_pressed & TAKEOFF_BIT and not is_flying and not command_pending:
+                            logger.info("離陸コマンド実行")
+                            start_flight_command(tello, "takeoff", drone_state)
 
                         # 着陸(B/Oボタン): 前回押されていなくて今回押された場合に実行
-                        if button_states["land"] and not prev_button_states["land"] and is_flying:
-                            print("着陸コマンド実行")
-                            if tello.land():
-                                is_flying = False
-                                # ドローン状態を更新
-                                drone_state["is_flying"] = False
-                                drone_state["rc_control_enabled"] = False
+                        if just_pressed & LAND_BIT and is_flying and not command_pending:
+                            logger.info("着陸コマンド実行")
+                            start_flight_command(tello, "land", drone_state)
 
                         # 緊急停止(X/□ボタン): 前回押されていなくて今回押された場合に実行
-                        if button_states["emergency"] and not prev_button_states["emergency"]:
-                            print("緊急停止コマンド実行")
-                            tello.send_command("emergency", wait_time=1)
+                        # 実行中のコマンドがあっても常に受け付け、RC送信は即座に止める
+                        if just_pressed & EMERGENCY_BIT:
+                            logger.info("緊急停止コマンド実行")
                             is_flying = False
                             # ドローン状態を更新
                             drone_state["is_flying"] = False
                             drone_state["rc_control_enabled"] = False
+                            start_flight_command(tello, "emergency", drone_state)
 
                         # 写真撮影機能は将来的に実装予定
-                        if button_states["photo"] and not prev_button_states["photo"]:
-                            print("写真撮影コマンド(未実装)")
+                        if just_pressed & PHOTO_BIT:
+                            logger.info("写真撮影コマンド(未実装)")
 
-                        # コントローラー入力をスレッドに共有
+                        # コントローラー入力を共有(input_dataは毎フレーム書き換えられるため、
+                        # RCスレッドにはスティック入力のスナップショットを渡す)
                         drone_state["last_controller_input"] = input_data
+                        movement = input_data["movement"]
+                        rc_input = (
+                            movement["x"],
+                            movement["y"],
+                            movement["z"],
+                            movement["rotation"],
+                        )
+                        # 値が変わったときだけ差し替えてRCスレッドを起こす
+                        if rc_input != drone_state["rc_input"]:
+                            drone_state["rc_input"] = rc_input
+                            rc_input_event.set()
 
                         # 前回のボタン状態を更新
-                        prev_button_states = button_states.copy()
-
-                # 定期的にFPSを計算(30フレームごと)
-                video.calculate_fps(interval=30)
-
-                # UI表示のためのフレーム処理
-                display_frame = frame.copy()
-
-                # テレメトリーデータの更新
-                telemetry_data = {
-                    "battery": drone_state.get("battery", -1),
-                    "is_flying": is_flying,
-                    "error_count": drone_state.get("error_count", 0),
-                    "connection_status": video.connection_status,
-                    "last_error": drone_state.get("last_error", ""),
+                        prev_pressed_bits = pressed_bits
+
+                # 別スレッドで完了した離陸・着陸の結果を表示に反映
+                is_flying = drone_state["is_flying"]
+
+                # FPSを計算(直近のフレーム時刻から算出)
+                video.calculate_fps()
+
+                # UI表示のためのフレーム処理(受信フレームを書き換えないようにバッファへコピー)
+                # 解像度が変わった場合(再接続時など)はバッファを確保し直す
+                if display_bufs is None or display_bufs[0].shape != frame.shape:
+                    display_bufs = [np.empty_like(frame), np.empty_like(frame)]
+                display_frame = display_bufs[active_buf]
+                np.copyto(display_frame, frame)
+                active_buf ^= 1
+
+                # テレメトリーデータとコントローラーの状態をまとめてHUDに描画
+                # (UI情報を非表示にしている間は値の収集も省く)
+                if video.show_info:
+                    # 状態受信スレッドが受信した最新のテレメトリー(約10Hz)を反映する
+                    # (受信済みの値を読むだけで応答待ちはしない)
+                    latest_state = tello.latest_state
+                    if latest_state:
+                        drone_state.update(latest_state)
+
+                    hud_state["battery"] = drone_state.get("battery", -1)
+                    hud_state["is_flying"] = is_flying
+                    hud_state["error_count"] = drone_state.get("error_count", 0)
+                    hud_state["connection_status"] = video.connection_status
+                    hud_state["last_error"] = drone_state.get("last_error", "")
                     # Extended telemetry data
-                    "height": drone_state.get("h"),  # Height (cm)
-                    "vgx": drone_state.get("vgx"),  # X-axis speed (cm/s)
-                    "vgy": drone_state.get("vgy"),  # Y-axis speed (cm/s)
-                    "vgz": drone_state.get("vgz"),  # Z-axis speed (cm/s)
-                    "pitch": drone_state.get("pitch"),  # Pitch angle (degrees)
-                    "roll": drone_state.get("roll"),  # Roll angle (degrees)
-                    "yaw": drone_state.get("yaw"),  # Yaw angle (degrees)
+                    hud_state["height"] = drone_state.get("h")  # Height (cm)
+                    hud_state["vgx"] = drone_state.get("vgx")  # X-axis speed (cm/s)
+                    hud_state["vgy"] = drone_state.get("vgy")  # Y-axis speed (cm/s)
+                    hud_state["vgz"] = drone_state.get("vgz")  # Z-axis speed (cm/s)
+                    hud_state["pitch"] = drone_state.get("pitch")  # Pitch angle (degrees)
+                    hud_state["roll"] = drone_state.get("roll")  # Roll angle (degrees)
+                    hud_state["yaw"] = drone_state.get("yaw")  # Yaw angle (degrees)
                     # Video statistics from improved decoder
-                    "decode_errors": video.decode_errors,
-                    "dropped_frames": video.dropped_frames,
-                    "total_frames": video.total_frames,
-                }
-
-                # テレメトリーデータの表示
-                display_frame = video.display_telemetry_data(display_frame, telemetry_data)
-
-                # コントローラーデータの表示
-                controller_data = (
-                    input_data if input_data else drone_state.get("last_controller_input")
-                )
-                # バッテリー情報も渡す
-                battery = drone_state.get("battery", -1)
-                display_frame = video.draw_controller_state(
-                    display_frame, controller_data, is_flying, battery, drone_state
-                )
+                    hud_state["decode_errors"] = video.decode_errors
+                    hud_state["dropped_frames"] = video.dropped_frames
+                    hud_state["total_frames"] = video.total_frames
+                    # コントローラーデータ(未接続時は最後の入力)
+                    hud_state["controller_input"] = (
+                        input_data if input_data else drone_state.get("last_controller_input")
+                    )
+
+                    display_frame = video.render_hud(display_frame, hud_state)
 
                 # フレームを表示
                 key = video.display_frame(display_frame)
 
                 # キー入力処理
                 if key & 0xFF == ord("q"):
-                    print("ユーザーによる終了")
+                    logger.info("ユーザーによる終了")
                     break
                 elif key & 0xFF == ord("i"):
                     # 'i'キーでUI情報表示の切り替え
                     show_info = video.toggle_info_display()
-                    print(f"UI情報表示: {'ON' if show_info else 'OFF'}")
+                    logger.info("UI情報表示: %s", "ON" if show_info else "OFF")
 
                 # ループの実行時間を測定(パフォーマンス監視用)
-                loop_time = time.time() - loop_start_time
+                loop_time = time.monotonic() - now
                 if loop_time > 0.05:  # 50ms以上かかる場合は警告(ループが遅い)
-                    print(f"警告: メインループの実行に時間がかかっています: {loop_time*1000:.1f}ms")
+                    logger.warning(
+                        "メインループの実行に時間がかかっています: %.1fms", loop_time * 1000
+                    )
 
                     # Adaptive sleep for performance management
                     if loop_time > 0.1:  # Very slow iterations
@@ -326,22 +365,24 @@ def main():
 
                         # If experiencing consistent performance issues, adjust processing load
                         if drone_state.get("performance_warnings", 0) > 10:
-                            print(
+                            logger.warning(
                                 "Performance optimization: "
                                 "Reducing processing load due to consistent slow frames"
                             )
                             # Reset counter after taking action
                             drone_state["performance_warnings"] = 0
 
-            except Exception as e:
-                print(f"メインループでエラーが発生しました: {e}")
+            # 通信・映像処理・コントローラーで起こりうるエラーのみ回復を試みる
+            # (それ以外の例外はバグとして外側で処理し、着陸させてから終了する)
+            except (OSError, ValueError, cv2.error, pygame.error) as e:
+                logger.error("メインループでエラーが発生しました: %s", e)
                 # エラー情報を保存
                 drone_state["error_count"] += 1
                 drone_state["last_error"] = str(e)
 
                 # 連続したエラーが多すぎる場合は短時間休止
                 if drone_state["error_count"] > 10:
-                    print("エラーが多発しています。システムを短時間休止します...")
+                    logger.warning("エラーが多発しています。システムを短時間休止します...")
                     drone_state["recovery_mode"] = True
                     time.sleep(1.0)
                     drone_state["error_count"] = 0
@@ -361,7 +402,8 @@ def main():
             video.release()
         if tello:
             # 安全のため、着陸コマンドを送信
-            if drone_state.get("is_flying", False):
+            # (離陸コマンドの完了待ちで終了した場合も、離陸済みの可能性があるため着陸させる)
+            if drone_state.get("is_flying", False) or drone_state["pending_command"] == "takeoff":
                 print("ドローンが飛行中のためコマンド実行: 着陸")
                 tello.land()
             tello.stop_video_stream()
@@ -372,7 +414,90 @@ def main():
         print("すべてのリソースを解放しました。プログラムを終了します。")
 
 
-def rc_control_thread(tello, controller, drone_state, exit_event):
+def start_flight_command(tello, command, drone_state):
+    """
+    離陸・着陸・緊急停止コマンドを別スレッドで開始する
+    コマンド送信後の待機(最大5秒)でビデオ表示とコントローラー処理が止まらないようにする
+
+    Parameters:
+        tello (TelloControl): Tello制御クラスのインスタンス
+        command (str): 実行するコマンド ("takeoff", "land", "emergency")
+        drone_state (dict): ドローンの状態とコントローラー入力を格納する辞書
+    """
+    drone_state["pending_command"] = command
+    Thread(target=flight_command_thread, args=(tello, command, drone_state), daemon=True).start()
+
+
+def flight_command_thread(tello, command, drone_state):
+    """
+    離陸・着陸・緊急停止コマンドを実行し、結果をdrone_stateに反映する
+
+    Parameters:
+        tello (TelloControl): Tello制御クラスのインスタンス
+        command (str): 実行するコマンド ("takeoff", "land", "emergency")
+        drone_state (dict): ドローンの状態とコントローラー入力を格納する辞書
+    """
+    try:
+        if command == "takeoff":
+            # 離陸待ちの間に緊急停止された場合は飛行状態にしない
+            if tello.takeoff() and drone_state["pending_command"] == "takeoff":
+                drone_state["is_flying"] = True
+                drone_state["rc_control_enabled"] = True
+        elif command == "land":
+            if tello.land() and drone_state["pending_command"] == "land":
+                drone_state["is_flying"] = False
+                drone_state["rc_control_enabled"] = False
+        elif command == "emergency":
+            tello.send_command("emergency", wait_time=1)
+    except Exception as e:
+        logger.error("%sコマンドの実行中にエラーが発生しました: %s", command, e)
+        drone_state["last_error"] = f"{command}: {e!s}"
+        drone_state["error_count"] += 1
+    finally:
+        # 後から開始された緊急停止の完了状態は上書きしない
+        if drone_state["pending_command"] == command:
+            drone_state["pending_command"] = None
+
+
+def telemetry_update_thread(tello, drone_state, exit_event, interval=10):
+    """
+    バッテリー残量を定期的に取得する別スレッド
+    テレメトリーは状態受信スレッドの値をメインループが毎フレーム反映するため、
+    状態受信用ソケットを作成できなかった場合のみここで"state?"により取得する
+
+    Parameters:
+        tello (TelloControl): Tello制御クラスのインスタンス
+        drone_state (dict): ドローンの状態とコントローラー入力を格納する辞書
+        exit_event (Event): プログラム終了を通知するイベント
+        interval (float): 取得間隔(秒)
+    """
+    # 終了が通知されるまで一定間隔で取得する(初期値はmain()で取得済み)
+    while not exit_event.wait(interval):
+        try:
+            # バッテリー情報の取得と更新
+            battery_level = tello.get_battery()
+            if battery_level > 0:
+                drone_state["battery"] = battery_level
+                # バッテリー残量が低い場合は警告
+                if battery_level <= 15:
+                    logger.warning("バッテリー残量が低下しています (%d%%)", battery_level)
+
+            # テレメトリーデータの取得と更新(状態受信スレッドが無い場合のみ)
+            if tello.state_thread is not None:
+                continue
+            telemetry_data = tello.get_telemetry_data()
+            if telemetry_data:
+                logger.debug("Received telemetry data: %s", telemetry_data)
+                # テレメトリー情報をdrone_stateに統合
+                for key, value in telemetry_data.items():
+                    drone_state[key] = value
+            else:
+                logger.info("No telemetry data received")
+        except (OSError, ValueError) as e:
+            logger.error("テレメトリー取得中にエラーが発生しました: %s", e)
+
+
+def rc_control_thread(tello, controller, drone_state, exit_event, input_event):
     """
     RCコマンド送信を担当する別スレッド
     メインループのフレームレート低下を防ぐ
@@ -382,45 +507,52 @@ def rc_control_thread(tello, controller, drone_state, exit_event):
         controller (ControllerManager): コントローラー管理クラスのインスタンス
         drone_state (dict): ドローンの状態とコントローラー入力を格納する辞書
         exit_event (Event): プログラム終了を通知するイベント
+        input_event (Event): スティック入力の更新を通知するイベント
     """
     print("RC制御スレッド開始")
-    last_rc_time = time.time()
+    last_rc_time = time.monotonic()
     rc_send_interval = 0.05  # RCコマンド送信間隔 (20Hz - より滑らかな制御のため)
     heartbeat_interval = 3  # ハートビート信号の送信間隔(秒)
-    last_heartbeat_time = time.time()
+    last_heartbeat_time = time.monotonic()
 
     # 連続して同じ値を送り続けるのを防ぐための変数
     last_rc_values = (0, 0, 0, 0)
+    current_rc_values = (0, 0, 0, 0)
+    last_rc_input = (0.0, 0.0, 0.0, 0.0)  # 前回RC値に変換したスティック入力
     idle_count = 0
-    max_idle_count = 10  # 10回同じ値が続いたら送信を一時停止
+    # 同じ値が続いた場合の再送までの判定回数(送信間隔ごとに判定するため約150msごとに再送)
+    max_idle_count = 2
 
     # 送信失敗時のリトライ関連設定
     retry_count = 0
     max_retries = 3
 
+    # エラーログの出力間隔(秒)。送信間隔ごとに失敗し続けてもログが溢れないように制限する
+    error_log_interval = 5.0
+    last_error_log_time = None
+    suppressed_errors = 0  # 前回のログ出力以降に出力を省略したエラーの数
+
     try:
         while not exit_event.is_set():
             try:
                 # スレッドセーフな方法で状態を取得
                 is_flying = drone_state.get("is_flying", False)
                 rc_enabled = drone_state.get("rc_control_enabled", False)
-                controller_input = drone_state.get("last_controller_input")
+                rc_input = drone_state["rc_input"]
 
-                current_time = time.time()
+                current_time = time.monotonic()
 
                 # 飛行中かつRC制御有効の場合
                 if is_flying and rc_enabled:
                     # 1. コントローラー入力の処理(メイン制御)
-                    if controller_input and current_time - last_rc_time > rc_send_interval:
-
-                        # movementが存在するか確認
-                        movements = controller_input.get("movement")
-                        if movements:
+                    if current_time - last_rc_time > rc_send_interval:
+                        # スティック入力が前回から変わっていなければ変換をやり直さない
+                        if rc_input != last_rc_input:
                             # コントローラー値を-100〜100の範囲にスケーリング
-                            left_right = int(movements.get("x", 0) * 100)  # 左右移動
-                            forward_backward = int(movements.get("y", 0) * 100)  # 前後移動
-                            up_down = int(movements.get("z", 0) * 100)  # 上下移動
-                            yaw = int(movements.get("rotation", 0) * 100)  # 回転
+                            # (左右移動、前後移動、上下移動、回転)
+                            left_right, forward_backward, up_down, yaw = (
+                                int(value * 100) for value in rc_input
+                            )
 
                             # 小さすぎる値は0とみなす(誤差の扱い改善)
                             if abs(left_right) < 5:
@@ -434,28 +566,25 @@ def rc_control_thread(tello, controller, drone_state, exit_event):
 
                             # 現在のRC値
                             current_rc_values = (left_right, forward_backward, up_down, yaw)
-
-                            # 値に変化があるか、または一定時間経過した場合のみ送信
-                            if current_rc_values != last_rc_values or idle_count >= max_idle_count:
-                                # RCコマンド送信(失敗時はリトライ)
-                                success = tello.send_rc_control(
-                                    left_right, forward_backward, up_down, yaw
-                                )
-                                if not success and retry_count < max_retries:
-                                    # 送信失敗時は短い間隔を空けてリトライ
-                                    retry_count += 1
-                                    time.sleep(0.02)
-                                    tello.send_rc_control(
-                                        left_right, forward_backward, up_down, yaw
-                                    )
-                                else:
-                                    retry_count = 0  # 成功またはリトライ上限に達したらリセット
-
-                                last_rc_time = current_time
-                                last_rc_values = current_rc_values
-                                idle_count = 0  # カウンターをリセット
+                            last_rc_input = rc_input
+
+                        # 値に変化があるか、または一定時間経過した場合のみ送信
+                        if current_rc_values != last_rc_values or idle_count >= max_idle_count:
+                            # RCコマンド送信(失敗時はリトライ)
+                            success = tello.send_rc_control(*current_rc_values)
+                            if not success and retry_count < max_retries:
+                                # 送信失敗時は短い間隔を空けてリトライ
+                                retry_count += 1
+                                time.sleep(0.02)
+                                tello.send_rc_control(*current_rc_values)
                             else:
-                                idle_count += 1
+                                retry_count = 0  # 成功またはリトライ上限に達したらリセット
+
+                            last_rc_time = current_time
+                            last_rc_values = current_rc_values
+                            idle_count = 0  # カウンターをリセット
+                        else:
+                            idle_count += 1
 
                     # 2. ハートビート信号の送信(接続を維持するための定期的なアイドルコマンド)
                     elif current_time - last_heartbeat_time > heartbeat_interval:
@@ -464,13 +593,29 @@ def rc_control_thread(tello, controller, drone_state, exit_event):
                         last_heartbeat_time = current_time
 
             except Exception as e:
-                print(f"RC制御処理でエラーが発生しました: {e}")
-                # エラー情報を状態に記録
+                # 最後のエラーは毎回記録し、ログ出力とエラーカウントは一定間隔に1回だけ行う
                 drone_state["last_error"] = f"RC制御: {e!s}"
-                drone_state["error_count"] += 1
+                now = time.monotonic()
+                if last_error_log_time is None or now - last_error_log_time >= error_log_interval:
+                    if suppressed_errors:
+                        logger.error(
+                            "RC制御処理でエラーが発生しました: %s (前回の出力以降に他%d件)",
+                            e,
+                            suppressed_errors,
+                        )
+                    else:
+                        logger.error("RC制御処理でエラーが発生しました: %s", e)
+                    drone_state["error_count"] += 1
+                    last_error_log_time = now
+                    suppressed_errors = 0
+                else:
+                    suppressed_errors += 1
 
-            # スレッドの負荷を軽減するためのスリープ (短い間隔でポーリング)
-            time.sleep(0.01)
+            # 新しいスティック入力が届くまで待機する(短い間隔でのポーリングはしない)
+            # 入力が無くても送信間隔ごとに起きて、同じ値の再送とハートビートを判定する
+            remaining = last_rc_time + rc_send_interval - time.monotonic()
+            input_event.wait(remaining if remaining > 0 else rc_send_interval)
+            input_event.clear()
     except Exception as e:
         print(f"RC制御スレッドでエラーが発生しました: {e}")
     finally:
@@ -3,12 +3,100 @@
 Tello XR Controller Module
 Telloドローンとの通信および制御を担当するモジュール
 """
+import logging
+import re
+import select
 import socket
+import threading
 import time
+from functools import lru_cache
+
+# コマンド送信ごとの出力はDEBUGレベルにし、RCコマンドの連続送信で標準出力を詰まらせない
+logger = logging.getLogger(__name__)
 
 # Telloドローンの通信設定用定数
 DEFAULT_TELLO_IP = "192.168.10.1"
 DEFAULT_TELLO_PORT = 8889
+TELLO_STATE_PORT = 8890  # Telloが状態(テレメトリー)を定期送信するポート(約10Hz)
+STATE_RECV_TIMEOUT = 1.0  # 状態受信スレッドが終了要求を確認する間隔(秒)
+COMMAND_SEND_TIMEOUT = 5.0  # コマンド送信のタイムアウト(秒)
+RESPONSE_TIMEOUT = 3.0  # コマンドへの応答を待つ時間(秒)
+
+# ソケットのバッファサイズ(RCコマンドの連続送信で取りこぼさないように既定値より大きくする)
+SOCKET_SNDBUF_SIZE = 1 << 16
+SOCKET_RCVBUF_SIZE = 1 << 18
+
+# 固定のコマンドは送信用のバイト列に変換しておく
+_COMMAND_BYTES = {
+    command: command.encode("ascii")
+    for command in (
+        "command",
+        "takeoff",
+        "land",
+        "emergency",
+        "streamon",
+        "streamoff",
+        "battery?",
+        "state?",
+        "rc 0 0 0 0",
+    )
+}
+
+# 状態文字列("pitch:0;roll:0;...;bat:87;baro:-42.31;...")から数値の項目を取り出す正規表現
+_STATE_PATTERN = re.compile(r"([a-z]+):(-?[0-9]+(?:\.[0-9]+)?)(?=;)")
+
+
+def _parse_state(text):
+    """
+    Telloの状態文字列から数値の項目を取り出す
+
+    Parameters:
+        text (str): 状態文字列
+
+    Returns:
+        dict: 項目名と値の辞書
+    """
+    return {key: float(value) for key, value in _STATE_PATTERN.findall(text)}
+
+
+@lru_cache(maxsize=512)
+def _encode_command(command):
+    """
+    可変のコマンド文字列を送信用のバイト列に変換する(変換結果はキャッシュする)
+
+    RCコマンドは同じ値が繰り返し送信されることが多いため、
+    毎回のエンコードによるバイト列の生成を避ける
+
+    Parameters:
+        command (str): 送信するコマンド
+
+    Returns:
+        bytes: UTF-8でエンコードしたコマンド
+    """
+    return command.encode("utf-8")
+
+
+@lru_cache(maxsize=512)
+def _rc_command(left_right, forward_backward, up_down, yaw):
+    """
+    RCコマンド文字列を作成する(作成結果はキャッシュする)
+
+    スティックを保持している間は同じ値の組が繰り返し送信されるため、
+    値の制限と文字列の組み立てを毎回行わないようにする
+
+    Parameters:
+        left_right (int): 左右の移動速度
+        forward_backward (int): 前後の移動速度
+        up_down (int): 上下の移動速度
+        yaw (int): 回転速度
+
+    Returns:
+        str: 各値を-100〜100に制限したRCコマンド
+    """
+    values = (int(left_right), int(forward_backward), int(up_down), int(yaw))
+    # 値の範囲を-100〜100に制限
+    clamped = [-100 if value < -100 else 100 if value > 100 else value for value in values]
+    return "rc " + " ".join(map(str, clamped))
 
 
 class TelloControl:
@@ -24,6 +112,11 @@ class TelloControl:
         """
         self.tello_address = (tello_ip, tello_port)
         self.sock = None
+        self.state_sock = None  # 状態受信用のソケット
+        self.state_thread = None  # 状態受信スレッド
+        self.latest_state = None  # 最後に受信した状態(受信スレッドが丸ごと差し替える)
+        # 応答を待つコマンドの送信から受信までを排他する(複数スレッドの問い合わせの取り違え防止)
+        self._response_lock = threading.Lock()
 
     def connect(self):
         """
@@ -34,12 +127,34 @@ class TelloControl:
         """
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            return True
+            # タイムアウトは接続時に一度だけ設定する(送信中に他のスレッドから変更しない)
+            self.sock.settimeout(COMMAND_SEND_TIMEOUT)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF_SIZE)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
         except OSError as e:
-            print(f"ソケット作成失敗: {e}")
+            logger.error("ソケット作成失敗: %s", e)
             return False
 
-    def send_command(self, command, wait_time=2.0, expect_response=False):
+        # 状態の受信用ソケット(Telloが定期送信する状態を別スレッドで受信し続ける)
+        # 作成できなくてもコマンドの送受信はできるため、接続は成功とする
+        try:
+            self.state_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.state_sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF_SIZE)
+            self.state_sock.bind(("", TELLO_STATE_PORT))
+            self.state_sock.settimeout(STATE_RECV_TIMEOUT)
+        except OSError as e:
+            logger.warning("状態受信用ソケットの作成失敗: %s", e)
+            if self.state_sock:
+                self.state_sock.close()
+            self.state_sock = None
+        else:
+            self.state_thread = threading.Thread(
+                target=self._state_receiver_loop, args=(self.state_sock,), daemon=True
+            )
+            self.state_thread.start()
+        return True
+
+    def send_command(self, command, wait_time=2.0, expect_response=False, accept=None):
         """
         Telloにコマンドを送信する
 
@@ -47,55 +162,69 @@ class TelloControl:
             command (str): 送信するコマンド
             wait_time (float): コマンド送信後の待機時間(秒)
             expect_response (bool): レスポンスを待機するか
+            accept (callable): 応答として受け付ける条件(Noneの場合はすべて受け付ける)。
+                条件を満たさない応答(他のコマンドへの遅れた"ok"など)は読み捨てて待ち続ける
 
         Returns:
             bool | str: expect_response=Falseの場合はTrue/False、Trueの場合はレスポンス文字列
         """
         if self.sock is None:
-            print("ソケットが初期化されていません")
+            logger.error("ソケットが初期化されていません")
             return False
 
         try:
-            # 送信前にソケットのタイムアウトを設定
-            self.sock.settimeout(5.0)
-            
-            # コマンドを送信
-            print(f"コマンド送信: {command}")
-            self.sock.sendto(command.encode("utf-8"), self.tello_address)
-            
+            logger.debug("コマンド送信: %s", command)
+            payload = _COMMAND_BYTES.get(command) or _encode_command(command)
+
             # レスポンスを期待する場合
-            response = None
-            response_socket = None
+            # (Telloはコマンドの応答を送信元のポートに返すため、コマンド用のソケットで受信する)
             if expect_response:
-                try:
-                    # レスポンス用のソケットを作成
-                    response_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    response_socket.bind(('', 8890))  # Telloからの応答を受け取るポート
-                    response_socket.settimeout(3.0)
-                    
-                    # レスポンス受信
-                    response_data, _ = response_socket.recvfrom(1518)
-                    response = response_data.decode(encoding="utf-8").strip()
-                    print(f"レスポンス: {response}")
-                    
-                except TimeoutError:
-                    print(f"{command} コマンドへのレスポンスがタイムアウトしました")
-                    response = None
-                finally:
-                    if response_socket:
-                        response_socket.close()
-            
+                # 他のスレッドの問い合わせと応答を取り違えないように、読み捨て・送信・受信を排他する
+                with self._response_lock:
+                    # 以前のコマンドへの遅れた応答を読み捨てる
+                    self._discard_pending_replies()
+                    self.sock.sendto(payload, self.tello_address)
+                    # 応答を待つコマンドは受信(またはタイムアウト)までで完了しているため待機しない
+                    return self._receive_response(command, accept)
+
+            # コマンドを送信
+            self.sock.sendto(payload, self.tello_address)
+
             # 処理時間を確保
             time.sleep(wait_time)
-            
-            if expect_response:
-                return response
             return True
-            
+
         except Exception as e:
-            print(f"コマンド送信エラー: {e}")
+            logger.error("コマンド送信エラー: %s", e)
             return False
 
+    def _receive_response(self, command, accept):
+        """
+        コマンドへの応答を受信する(_response_lockを取得した状態で呼び出す)
+
+        Parameters:
+            command (str): 応答を待つコマンド(ログ出力用)
+            accept (callable): 応答として受け付ける条件、Noneの場合はすべて受け付ける
+
+        Returns:
+            str: レスポンス文字列、タイムアウトした場合はNone
+        """
+        # ソケットのタイムアウトは変更せず、selectの待ち時間で応答の期限を管理する
+        deadline = time.monotonic() + RESPONSE_TIMEOUT
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self.sock], [], [], remaining)[0]:
+                logger.warning("%s コマンドへのレスポンスがタイムアウトしました", command)
+                return None
+
+            # レスポンス受信
+            response_data, _ = self.sock.recvfrom(1518)
+            response = response_data.decode(encoding="utf-8").strip()
+            logger.debug("レスポンス: %s", response)
+            if accept is None or accept(response):
+                return response
+            logger.debug("%s コマンドの応答ではないため読み捨てます: %s", command, response)
+
     def activate_sdk_mode(self):
         """
         SDKモードをアクティブ化する
@@ -136,13 +265,13 @@ class TelloControl:
         """
         # 距離の範囲を確認(20-500cm)
         if not (20 <= distance <= 500):
-            print(f"移動距離は20-500cmの範囲内である必要があります: {distance}cm")
+            logger.warning("移動距離は20-500cmの範囲内である必要があります: %scm", distance)
             return False
         
         # 方向を確認
         valid_directions = ['forward', 'back', 'left', 'right', 'up', 'down']
         if direction not in valid_directions:
-            print(f"無効な方向です: {direction}")
+            logger.warning("無効な方向です: %s", direction)
             return False
         
         # 移動コマンドを送信
@@ -176,15 +305,9 @@ class TelloControl:
         Returns:
             bool: 成功したらTrue、失敗したらFalse
         """
-        # 値の範囲を-100〜100に制限
-        left_right = max(-100, min(100, int(left_right)))
-        forward_backward = max(-100, min(100, int(forward_backward)))
-        up_down = max(-100, min(100, int(up_down)))
-        yaw = max(-100, min(100, int(yaw)))
-        
         # rcコマンドの送信(待機時間はほぼ0)
         result = self.send_command(
-            f"rc {left_right} {forward_backward} {up_down} {yaw}", wait_time=0.05
+            _rc_command(left_right, forward_backward, up_down, yaw), wait_time=0.05
         )
         # 文字列や他の型の場合はTrueと見なす(正常に送信された)
         return bool(result)
@@ -214,7 +337,9 @@ class TelloControl:
         Returns:
             int: バッテリー残量(%)、エラー時は-1
         """
-        response = self.send_command("battery?", wait_time=0.5, expect_response=True)
+        response = self.send_command(
+            "battery?", wait_time=0.5, expect_response=True, accept=str.isdigit
+        )
         try:
             if response and isinstance(response, str) and response.isdigit():
                 return int(response)
@@ -229,38 +354,70 @@ class TelloControl:
         Returns:
             dict: テレメトリーデータ(高度、姿勢、速度など)、エラー時はNone
         """
+        # 状態受信スレッドが動いていれば、最後に受信した状態をそのまま返す
+        if self.state_thread is not None:
+            return self.latest_state
+
         # Telloから状態情報を取得
-        response = self.send_command("state?", wait_time=0.5, expect_response=True)
+        response = self.send_command(
+            "state?", wait_time=0.5, expect_response=True, accept=_STATE_PATTERN.search
+        )
         if not response or not isinstance(response, str):
             return None
         
         try:
-            # レスポンスをキーと値のペアに分割
-            data = {}
-            for pair in response.split(';'):
-                if not pair:
-                    continue
-                key, _, value = pair.partition(':')
-                # 数値に変換可能な値を変換
-                try:
-                    data[key] = float(value)
-                except ValueError:
-                    data[key] = value
-            return data
+            # 数値の項目をまとめて抽出し、キーと値のペアに変換
+            return _parse_state(response)
         except Exception as e:
-            print(f"テレメトリーデータの解析エラー: {e}")
+            logger.error("テレメトリーデータの解析エラー: %s", e)
             return None
 
+    def _discard_pending_replies(self):
+        """コマンド用ソケットに届いている未読の応答をすべて読み捨てる"""
+        # タイムアウト0のselectで受信済みかを確認する(Windowsでも使えるようにMSG_DONTWAITは使わない)
+        while select.select([self.sock], [], [], 0)[0]:
+            self.sock.recvfrom(1518)
+
+    def _state_receiver_loop(self, state_sock):
+        """
+        Telloが定期送信する状態を受信し続け、最新の状態を保持する(状態受信スレッド)
+
+        Parameters:
+            state_sock (socket.socket): 状態受信用のソケット
+        """
+        while True:
+            try:
+                data = state_sock.recv(1518)
+            except TimeoutError:
+                continue  # 未受信の間も定期的にソケットが閉じられていないか確認する
+            except OSError:
+                break  # close()でソケットが閉じられた
+
+            try:
+                state = _parse_state(data.decode(encoding="utf-8"))
+            except ValueError:
+                continue  # 壊れたパケットは読み捨てる
+            if state:
+                self.latest_state = state
+
     def close(self):
         """ソケットを閉じる"""
+        if self.state_sock:
+            self.state_sock.close()
+            self.state_sock = None
+        if self.state_thread:
+            self.state_thread.join(timeout=STATE_RECV_TIMEOUT * 2)
+            self.state_thread = None
         if self.sock:
             self.sock.close()
             self.sock = None
-            print("Telloとの接続を閉じました")
+            logger.info("Telloとの接続を閉じました")
 
 
 # 単体テスト用コード
 if __name__ == "__main__":
+    # 単体テストでは送信したコマンドとレスポンスも表示する
+    logging.basicConfig(level=logging.DEBUG)
     tello = TelloControl()
     if tello.connect():
         try:
@@ -3,12 +3,74 @@
 Tello XR Video Stream Module - Enhanced with optimized H.264 decoding
 Video stream processor for Tello drone with improved frame handling and error recovery
 """
+import os
+import re
+import sys
+import threading
 import time
+from collections import deque
 
 import cv2
 
 # Tello video stream address constant
 TELLO_VIDEO_STREAM_ADDRESS = "udp://0.0.0.0:11111"
+TELLO_VIDEO_PORT = 11111
+
+# Hardware H.264 decoder stages tried in order when OpenCV is built with GStreamer
+# (Jetson, NVIDIA desktop GPUs, Intel/AMD VA-API)
+GSTREAMER_HW_DECODERS = (
+    "nvv4l2decoder ! nvvidconv ! video/x-raw,format=BGRx",
+    "nvh264dec",
+    "vaapih264dec",
+)
+
+# Whether this OpenCV build can open GStreamer pipelines (pip wheels cannot)
+HAVE_GSTREAMER = re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()) is not None
+
+# FFmpeg capture options tuned for low-latency UDP input
+FFMPEG_OPTIONS = {
+    "rtsp_transport": "udp",
+    "fflags": "nobuffer",  # Reduce latency
+    "flags": "low_delay",  # Prioritize low latency
+    "max_delay": "0",  # Do not hold packets in the demuxer for reordering
+    "framedrop": "true",  # Allow frame drops to maintain sync
+    "strict": "experimental",  # Enable experimental features
+    "probesize": "32",  # Small probe size for faster start
+    "analyzeduration": "0",  # Minimal analyze time
+    "scan_all_pmts": "true",  # Scan all program map tables
+    # UDP socket options: absorb IDR-frame bursts instead of dropping packets
+    "buffer_size": "4194304",  # Kernel receive buffer (SO_RCVBUF, 4 MB)
+    "fifo_size": "1000000",  # Receive-thread FIFO in 188-byte packets
+    "overrun_nonfatal": "1",  # Keep receiving if the FIFO overflows
+}
+
+# OpenCV passes these to avformat_open_input() as "key;value|key;value"
+# (options appended to the URL are not applied to the UDP demuxer)
+FFMPEG_CAPTURE_OPTIONS = "|".join(f"{k};{v}" for k, v in FFMPEG_OPTIONS.items())
+
+# Maximum time read_frame() waits for the grabber thread to deliver a new frame (seconds)
+FRAME_WAIT_TIMEOUT = 0.5
+
+# Capture open/read timeouts so a missing stream fails fast instead of blocking (milliseconds)
+CAPTURE_TIMEOUT_MSEC = 1000
+
+# Number of recent frame timestamps the FPS is averaged over
+FPS_WINDOW = 64
+
+# Connection retry backoff: starts at the initial delay and doubles up to the maximum (seconds)
+RETRY_DELAY_INITIAL = 0.1
+RETRY_DELAY_MAX = 0.5
+
+# Maximum number of measured text sizes kept before the cache is reset
+TEXT_SIZE_CACHE_MAX = 256
+
+
+def _display_available():
+    """Return False on Linux sessions without an X11 or Wayland display (e.g. headless runs)"""
+    if not sys.platform.startswith("linux"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
 
 # Display English-only notification
 print("INFO: Using enhanced video stream with optimized H.264 decoding")
@@ -17,20 +79,46 @@ print("INFO: Using enhanced video stream with optimized H.264 decoding")
 class VideoStream:
     """Class to handle video streaming from Tello drone with improved H.264 decoding"""
 
-    def __init__(self):
-        """Initialize the VideoStream class with optimized settings"""
+    def __init__(self, drop_to_latest=True, no_display=None):
+        """
+        Initialize the VideoStream class with optimized settings
+
+        Parameters:
+            drop_to_latest (bool): Skip frames the consumer was too slow to read so
+                read_frame() always returns the newest one (False delivers every frame,
+                e.g. for recording)
+            no_display (bool): Skip window output entirely (None detects a missing display)
+        """
         self.cap = None
+        self.drop_to_latest = drop_to_latest
         self.frame_count = 0
-        self.start_time = time.time()
+        self.frame_times = deque(maxlen=FPS_WINDOW)  # Monotonic times of recent frames
         self.fps = 0
-        self.show_info = True  # UI information display flag
-        self.last_frame_time = time.time()  # Frame acquisition time measurement
+        if no_display is None:
+            no_display = not _display_available()
+        self.no_display = no_display  # Headless mode: display_frame() does nothing
+        self.show_info = not no_display  # UI information display flag (no HUD when headless)
+        self.last_frame_time = time.monotonic()  # Frame acquisition time measurement
         self.dropped_frames = 0  # Dropped frame counter
         self.total_frames = 0  # Total frame counter
         self.connection_status = "Not Connected"  # Connection status
         self.last_successful_frame = None  # Store the last successful frame for stability
         self.decode_errors = 0  # Counter for H.264 decode errors
-        self.prev_decode_check_time = time.time()  # Time of the last decode error check
+        self.prev_decode_check_time = time.monotonic()  # Time of the last decode error check
+
+        # Background grabber state: the grabber thread calls cap.grab() continuously so
+        # stale frames are dropped, and read_frame() only retrieves the newest one
+        self._grab_cond = threading.Condition()
+        self._grab_thread = None
+        self._grab_running = False
+        self._grab_failed = False
+        self._grab_seq = 0  # Number of frames grabbed so far
+        self._retrieved_seq = 0  # Value of _grab_seq at the last retrieve
+        self._retrieve_waiting = False  # read_frame() wants the capture for retrieve()
+        self.latest_ts = 0.0  # Monotonic time of the newest grabbed frame
+        self._frame_buf = None  # Decoded frames are written into this buffer in place
+        self._try_gstreamer = HAVE_GSTREAMER  # Cleared once no hardware decoder could be opened
+        self._text_size_cache = {}  # (text, font_scale, thickness) -> (width, height)
 
     def connect(self, retry_limit=5):
         """
@@ -43,6 +131,7 @@ class VideoStream:
             bool: True if connection succeeds, False otherwise
         """
         retry_count = 0
+        retry_delay = RETRY_DELAY_INITIAL
 
         while self.cap is None and retry_count < retry_limit:
             try:
@@ -54,25 +143,13 @@ class VideoStream:
                     print("OpenCL acceleration is available and enabled")
                     cv2.setUseOptimized(True)
 
-                # Create FFmpeg command with optimizations for UDP stream
-                ffmpeg_options = {
-                    "rtsp_transport": "udp",
-                    "fflags": "nobuffer",  # Reduce latency
-                    "flags": "low_delay",  # Prioritize low latency
-                    "framedrop": "true",  # Allow frame drops to maintain sync
-                    "strict": "experimental",  # Enable experimental features
-                    "probesize": "32",  # Small probe size for faster start
-                    "analyzeduration": "0",  # Minimal analyze time
-                    "scan_all_pmts": "true",  # Scan all program map tables
-                }
-
-                # Build the FFmpeg command string from options
-                ffmpeg_cmd = " ".join([f"{k}={v}" for k, v in ffmpeg_options.items()])
-
-                # Initialize capture with FFmpeg options
-                self.cap = cv2.VideoCapture(
-                    TELLO_VIDEO_STREAM_ADDRESS + "?" + ffmpeg_cmd, cv2.CAP_FFMPEG
-                )
+                # Prefer a hardware decoder through GStreamer when this OpenCV build supports it
+                if self._try_gstreamer:
+                    self.cap = self._open_gstreamer_capture()
+                    self._try_gstreamer = self.cap is not None
+
+                if self.cap is None:
+                    self.cap = self._open_ffmpeg_capture()
 
                 # Further optimizations for video capture
                 self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Smaller buffer for reduced latency
@@ -81,20 +158,28 @@ class VideoStream:
                 # Check if connection was successful
                 if not self.cap.isOpened():
                     print(f"Failed to open camera (attempt {retry_count+1}/{retry_limit})")
-                    time.sleep(1.5)
+                    time.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
                     retry_count += 1
                     self.cap = None
                     continue
 
-                # Initialize the decoder with dummy reads
+                # Probe the decoder with a single grab (no dummy reads or fixed sleeps)
+                # The read timeout bounds the wait; a stream that delivers nothing is retried
                 print("Initializing video decoder...")
-                for _ in range(5):
-                    self.cap.read()
-                    time.sleep(0.1)
+                if not self.cap.grab():
+                    print(f"No video data received (attempt {retry_count+1}/{retry_limit})")
+                    self.cap.release()
+                    self.cap = None
+                    time.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
+                    retry_count += 1
+                    continue
 
                 print("Camera connected successfully!")
                 self.connection_status = "Connected"
                 self.decode_errors = 0
+                self._start_grabber()
                 return True
 
             except Exception as e:
@@ -102,13 +187,72 @@ class VideoStream:
                 if self.cap:
                     self.cap.release()
                     self.cap = None
-                time.sleep(1.5)
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, RETRY_DELAY_MAX)
                 retry_count += 1
 
         print("Failed to connect to video stream")
         self.connection_status = "Not Connected"
         return False
 
+    def _open_ffmpeg_capture(self):
+        """
+        Open the stream with the FFmpeg backend tuned for low-latency UDP input
+
+        Returns:
+            cv2.VideoCapture: Capture object (check isOpened())
+        """
+        # OpenCV reads the options from the environment when the capture is opened
+        os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = FFMPEG_CAPTURE_OPTIONS
+
+        # Initialize capture with FFmpeg options
+        # VIDEO_ACCELERATION_ANY lets libavcodec use NVDEC/VAAPI/D3D11/VideoToolbox when
+        # available and silently falls back to software decoding otherwise
+        return cv2.VideoCapture(
+            TELLO_VIDEO_STREAM_ADDRESS,
+            cv2.CAP_FFMPEG,
+            [
+                cv2.CAP_PROP_OPEN_TIMEOUT_MSEC,
+                CAPTURE_TIMEOUT_MSEC,
+                cv2.CAP_PROP_READ_TIMEOUT_MSEC,
+                CAPTURE_TIMEOUT_MSEC,
+                cv2.CAP_PROP_HW_ACCELERATION,
+                cv2.VIDEO_ACCELERATION_ANY,
+            ],
+        )
+
+    def _open_gstreamer_capture(self):
+        """
+        Open the stream through a GStreamer pipeline with a hardware H.264 decoder
+
+        Returns:
+            cv2.VideoCapture: Opened capture, None if none of the decoders is available
+        """
+        for decoder in GSTREAMER_HW_DECODERS:
+            pipeline = (
+                f"udpsrc port={TELLO_VIDEO_PORT} ! video/x-h264,stream-format=byte-stream"
+                f" ! h264parse ! {decoder} ! videoconvert ! video/x-raw,format=BGR"
+                " ! appsink drop=true max-buffers=1 sync=false"
+            )
+            # Same open/read timeouts as the FFmpeg path so grab() cannot outlive release()
+            cap = cv2.VideoCapture(
+                pipeline,
+                cv2.CAP_GSTREAMER,
+                [
+                    cv2.CAP_PROP_OPEN_TIMEOUT_MSEC,
+                    CAPTURE_TIMEOUT_MSEC,
+                    cv2.CAP_PROP_READ_TIMEOUT_MSEC,
+                    CAPTURE_TIMEOUT_MSEC,
+                ],
+            )
+            if cap.isOpened():
+                print(f"Using GStreamer hardware decoder: {decoder.split(' ', 1)[0]}")
+                return cap
+            cap.release()
+
+        print("No GStreamer hardware decoder available, using FFmpeg")
+        return None
+
     def read_frame(self):
         """
         Read one frame with improved error handling and frame stability
@@ -120,8 +264,9 @@ class VideoStream:
             self.connection_status = "Disconnected"
             return False, None
 
-        # Record frame timing for performance measurement
-        now = time.time()
+        # Record frame timing for performance measurement (monotonic, so clock steps
+        # cannot produce bogus intervals)
+        now = time.monotonic()
         frame_interval = now - self.last_frame_time
 
         # Check if we're having frequent decode errors
@@ -131,6 +276,7 @@ class VideoStream:
                     f"WARNING: High H.264 decode error rate detected ({self.decode_errors} in 5s). "
                     f"Reinitializing decoder..."
                 )
+                self._stop_grabber()
                 self.cap.release()
                 self.cap = None
                 self.connect(retry_limit=2)  # Try to reconnect with limited retries
@@ -142,15 +288,18 @@ class VideoStream:
             if self.cap is None:
                 return False, None
 
-            ret, frame = self.cap.read()
+            ret, frame = self._retrieve_latest()
             # Update timing information
-            self.last_frame_time = time.time()
+            self.last_frame_time = time.monotonic()
 
-            if ret and frame is not None and frame.size > 0:
+            if ret and frame is not None and frame.shape[0] > 0:
                 self.frame_count += 1
+                self.frame_times.append(self.last_frame_time)
                 self.total_frames += 1
                 self.connection_status = "Connected"
-                self.last_successful_frame = frame.copy()  # Store successful frame
+                # Store successful frame (the decode buffer is only overwritten by the
+                # next successful decode, so no copy is needed)
+                self.last_successful_frame = frame
 
                 # If frame interval is too long, it may indicate a frame drop
                 if frame_interval > 0.1:  # More than 100ms between frames
@@ -176,22 +325,122 @@ class VideoStream:
             self.connection_status = "Read Error"
             return False, None
 
-    def calculate_fps(self, interval=30):
+    @property
+    def is_grabbing(self):
+        """Whether the background grabber thread is running"""
+        return self._grab_thread is not None
+
+    def _start_grabber(self):
+        """Start the background thread that keeps grabbing the newest frame"""
+        self._grab_running = True
+        self._grab_failed = False
+        self._grab_seq = self._retrieved_seq = 0
+        self._grab_thread = threading.Thread(target=self._grab_loop, daemon=True)
+        self._grab_thread.start()
+
+    def _stop_grabber(self):
+        """Stop the grabber thread before the capture is released"""
+        if self._grab_thread is None:
+            return
+        with self._grab_cond:
+            self._grab_running = False
+            self._grab_cond.notify_all()
+        self._grab_thread.join(timeout=2.0)
+        self._grab_thread = None
+
+    def _grab_loop(self):
+        """
+        Grab frames as fast as the stream delivers them (grabber thread)
+
+        grab() only demuxes and decodes, so frames the consumer never asks for are
+        dropped without the cost of the BGR conversion done by retrieve().
+        """
+        cond = self._grab_cond
+        while self._grab_running:
+            with cond:
+                # Let a waiting read_frame() retrieve the frame that was just grabbed
+                # (without dropping, every grabbed frame waits until it is retrieved)
+                while (
+                    self._grab_running
+                    and (self._retrieve_waiting or not self.drop_to_latest)
+                    and self._grab_seq != self._retrieved_seq
+                ):
+                    cond.wait(0.1)
+                if not self._grab_running:
+                    break
+
+                ok = self.cap.grab()
+                if ok:
+                    self._grab_seq += 1
+                    self.latest_ts = time.monotonic()
+                self._grab_failed = not ok
+                cond.notify_all()
+
+            if not ok:
+                time.sleep(0.01)  # Avoid spinning while the stream is down
+
+    def _retrieve_latest(self):
+        """
+        Retrieve the newest grabbed frame, waiting for one if it was already retrieved
+
+        Returns:
+            tuple: (success flag, frame image)
+        """
+        if self._grab_thread is None:
+            return self._decode_into_buffer(self.cap.read)
+
+        cond = self._grab_cond
+        self._retrieve_waiting = True
+        if not cond.acquire(timeout=FRAME_WAIT_TIMEOUT):
+            self._retrieve_waiting = False
+            return False, None
+        try:
+            # Skip retrieving when no frame was grabbed since the last call
+            has_new_frame = cond.wait_for(
+                lambda: self._grab_seq != self._retrieved_seq or self._grab_failed,
+                FRAME_WAIT_TIMEOUT,
+            )
+            if not has_new_frame or self._grab_seq == self._retrieved_seq:
+                return False, None
+
+            # Frames grabbed since the last retrieve were skipped in favour of the newest one
+            self.dropped_frames += self._grab_seq - self._retrieved_seq - 1
+            self._retrieved_seq = self._grab_seq
+            return self._decode_into_buffer(self.cap.retrieve)
+        finally:
+            self._retrieve_waiting = False
+            cond.notify_all()
+            cond.release()
+
+    def _decode_into_buffer(self, decode):
         """
-        Calculate FPS (updated every 'interval' frames)
+        Decode a frame into the reusable frame buffer
 
         Parameters:
-            interval (int): Number of frames between FPS calculations
+            decode: cap.read or cap.retrieve
+
+        Returns:
+            tuple: (success flag, frame image)
+        """
+        # OpenCV writes into the buffer when its shape matches and allocates a new
+        # one otherwise (first frame or resolution change), which is then kept
+        ret, frame = decode(self._frame_buf)
+        if ret:
+            self._frame_buf = frame
+        return ret, frame
+
+    def calculate_fps(self):
+        """
+        Calculate FPS averaged over the last FPS_WINDOW received frames
 
         Returns:
             float: Current FPS value
         """
-        if self.frame_count % interval == 0 and self.frame_count > 0:
-            current_time = time.time()
-            elapsed = current_time - self.start_time
+        frame_times = self.frame_times
+        if len(frame_times) >= 2:
+            elapsed = frame_times[-1] - frame_times[0]
             if elapsed > 0:
-                self.fps = interval / elapsed
-                self.start_time = current_time
+                self.fps = (len(frame_times) - 1) / elapsed
 
         return self.fps
 
@@ -204,10 +453,13 @@ class VideoStream:
             window_name (str): Name of display window
 
         Returns:
-            int: Key input value (27 for ESC, 113 for 'q')
+            int: Key input value (27 for ESC, 113 for 'q'; -1 when headless)
         """
+        if self.no_display:
+            return -1
         cv2.imshow(window_name, frame)
-        return cv2.waitKey(1)
+        # pollKey() handles window events without waitKey()'s minimum 1ms wait
+        return cv2.pollKey()
 
     def add_text_to_frame(
         self,
@@ -235,14 +487,23 @@ class VideoStream:
             Frame with text added
         """
         # テキストに日本語が含まれる場合は英語に置換
-        text = "".join(char if ord(char) < 128 else "?" for char in text)
+        # (英語のみのテキストはisascii()で素通りし、置換はCのコーデックで行う)
+        if not text.isascii():
+            text = text.encode("ascii", "replace").decode("ascii")
 
         # 標準的なOpenCVテキスト描画を使用
         font = cv2.FONT_HERSHEY_SIMPLEX
 
-        # テキストのサイズを取得
+        # テキストのサイズを取得(同じ文字列は前回の計測結果を再利用)
         if bg_color is not None:
-            text_size, _ = cv2.getTextSize(text, font, font_scale, thickness)
+            key = (text, font_scale, thickness)
+            text_size = self._text_size_cache.get(key)
+            if text_size is None:
+                # 値が変わり続けるテキストでキャッシュが膨らまないように上限で破棄
+                if len(self._text_size_cache) >= TEXT_SIZE_CACHE_MAX:
+                    self._text_size_cache.clear()
+                text_size, _ = cv2.getTextSize(text, font, font_scale, thickness)
+                self._text_size_cache[key] = text_size
             text_w, text_h = text_size
 
             # テキストの背景を描画
@@ -378,27 +639,22 @@ class VideoStream:
 
         h, w = frame.shape[:2]
 
-        # Create semi-transparent overlay (for telemetry panel)
-        overlay = frame.copy()
         panel_width = 250  # Expanded panel width
         panel_height = 200  # Expanded panel height
-        panel_x = w - panel_width - 10
+        panel_x = max(w - panel_width - 10, 0)
         panel_y = 10
 
+        # Create semi-transparent overlay only for the panel region (not the whole frame);
+        # drawing below uses panel-local coordinates
+        panel_roi = frame[panel_y : panel_y + panel_height + 1, panel_x : panel_x + panel_width + 1]
+        overlay = panel_roi.copy()
+
         # Panel background
-        cv2.rectangle(
-            overlay,
-            (panel_x, panel_y),
-            (panel_x + panel_width, panel_y + panel_height),
-            (0, 0, 0),
-            -1,
-        )
+        cv2.rectangle(overlay, (0, 0), (panel_width, panel_height), (0, 0, 0), -1)
 
         # Display telemetry data
-        y_offset = panel_y + 20
-        self.add_text_to_frame(
-            overlay, "Telemetry", (panel_x + 10, y_offset), 0.7, (255, 255, 255), 2
-        )
+        y_offset = 20
+        self.add_text_to_frame(overlay, "Telemetry", (10, y_offset), 0.7, (255, 255, 255), 2)
 
         # Battery
         battery = telemetry_data.get("battery", -1)
@@ -411,7 +667,7 @@ class VideoStream:
                 battery_color = (0, 165, 255)  # Orange
 
             self.add_text_to_frame(
-                overlay, f"Battery: {battery}%", (panel_x + 10, y_offset), 0.6, battery_color, 1
+                overlay, f"Battery: {battery}%", (10, y_offset), 0.6, battery_color, 1
             )
 
         # Height (if available)
@@ -419,7 +675,7 @@ class VideoStream:
         if height is not None:
             y_offset += 25
             self.add_text_to_frame(
-                overlay, f"Height: {height}cm", (panel_x + 10, y_offset), 0.6, (255, 255, 255), 1
+                overlay, f"Height: {height}cm", (10, y_offset), 0.6, (255, 255, 255), 1
             )
 
         # Speed information
@@ -429,13 +685,11 @@ class VideoStream:
         if all(v is not None for v in [speed_x, speed_y, speed_z]):
             y_offset += 25
             speed_text = f"Speed: X:{speed_x} Y:{speed_y} Z:{speed_z}"
-            self.add_text_to_frame(
-                overlay, speed_text, (panel_x + 10, y_offset), 0.6, (255, 255, 255), 1
-            )
+            self.add_text_to_frame(overlay, speed_text, (10, y_offset), 0.6, (255, 255, 255), 1)
 
             # Display speed vector visually (optional)
             if abs(speed_x) > 3 or abs(speed_y) > 3:  # Only if speed is above threshold
-                indicator_x = panel_x + 125
+                indicator_x = 125
                 indicator_y = y_offset + 15
                 indicator_scale = 2.0
 
@@ -458,16 +712,14 @@ class VideoStream:
         if all(v is not None for v in [pitch, roll, yaw]):
             y_offset += 25
             attitude_text = f"Attitude: P:{pitch}° R:{roll}° Y:{yaw}°"
-            self.add_text_to_frame(
-                overlay, attitude_text, (panel_x + 10, y_offset), 0.6, (255, 255, 255), 1
-            )
+            self.add_text_to_frame(overlay, attitude_text, (10, y_offset), 0.6, (255, 255, 255), 1)
 
         # Error information
         error_count = telemetry_data.get("error_count", 0)
         if error_count > 0:
             y_offset += 25
             self.add_text_to_frame(
-                overlay, f"Errors: {error_count}", (panel_x + 10, y_offset), 0.6, (0, 0, 255), 1
+                overlay, f"Errors: {error_count}", (10, y_offset), 0.6, (0, 0, 255), 1
             )
 
         # Connection status
@@ -485,21 +737,45 @@ class VideoStream:
 
         conn_color = (0, 255, 0) if connection_status == "Connected" else (0, 0, 255)
         self.add_text_to_frame(
-            overlay, f"Status: {connection_status}", (panel_x + 10, y_offset), 0.6, conn_color, 1
+            overlay, f"Status: {connection_status}", (10, y_offset), 0.6, conn_color, 1
         )
 
         # Frame statistics
         y_offset += 25
         self.add_text_to_frame(
-            overlay, f"FPS: {self.fps:.1f}", (panel_x + 10, y_offset), 0.6, (255, 255, 255), 1
+            overlay, f"FPS: {self.fps:.1f}", (10, y_offset), 0.6, (255, 255, 255), 1
         )
 
-        # Blend overlay (semi-transparent)
+        # Blend overlay into the panel region (semi-transparent)
         alpha = 0.7
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+        cv2.addWeighted(overlay, alpha, panel_roi, 1 - alpha, 0, panel_roi)
 
         return frame
 
+    def render_hud(self, frame, hud_state):
+        """
+        Draw the telemetry panel and controller state onto a frame in one call
+
+        Parameters:
+            frame: Target frame to draw on
+            hud_state (dict): Telemetry data (see display_telemetry_data) plus
+                "controller_input" and "drone_state" entries
+
+        Returns:
+            Frame with UI added
+        """
+        if not self.show_info:
+            return frame
+
+        frame = self.display_telemetry_data(frame, hud_state)
+        return self.draw_controller_state(
+            frame,
+            hud_state.get("controller_input"),
+            hud_state.get("is_flying", False),
+            hud_state.get("battery"),
+            hud_state.get("drone_state"),
+        )
+
     def toggle_info_display(self):
         """Toggle display of information overlay"""
         self.show_info = not self.show_info
@@ -507,10 +783,12 @@ class VideoStream:
 
     def release(self):
         """Release all resources"""
+        self._stop_grabber()
         if self.cap is not None:
             self.cap.release()
             self.cap = None
-        cv2.destroyAllWindows()
+        if not self.no_display:
+            cv2.destroyAllWindows()
         print("Video stream closed successfully")
 
 
@@ -528,7 +806,8 @@ if __name__ == "__main__":
                     continue
 
                 fps = stream.calculate_fps()
-                if fps > 0:
+                # Print once per FPS window instead of every frame
+                if fps > 0 and stream.frame_count % FPS_WINDOW == 0:
                     print(f"Current FPS: {fps:.2f}")
 
                 key = stream.display_frame(frame)